@@ -5,9 +5,9 @@ Walks Pydantic IR models and emits IEC 61131-3 Structured Text.
 
 from __future__ import annotations
 
+import functools
 import re
-from io import StringIO
-from typing import Union, overload
+from typing import NamedTuple, Union, overload
 
 from plx.model.expressions import (
     ArrayAccessExpr,
@@ -89,7 +89,7 @@ def to_structured_text(target: Union[Project, POU], *, source_map: bool = False)
     ``var_source_map`` is a list of ``{"name", "line", "column"}`` dicts
     mapping each variable reference to its 1-indexed position in the ST output.
     """
-    w = STWriter()
+    w = STWriter(collect_variable_names=source_map)
     if isinstance(target, Project):
         w.write_project(target)
     elif isinstance(target, POU):
@@ -103,8 +103,7 @@ def to_structured_text(target: Union[Project, POU], *, source_map: bool = False)
     if not source_map:
         return st_text
 
-    var_names = _collect_variable_names(target)
-    smap = _build_source_map(st_text, var_names)
+    smap = [entry._asdict() for entry in _build_source_map(st_text, w.variable_names)]
     return st_text, smap
 
 
@@ -163,32 +162,40 @@ _SHIFT_OPS = {BinaryOp.SHL, BinaryOp.SHR, BinaryOp.ROL, BinaryOp.ROR}
 # ---------------------------------------------------------------------------
 
 class STWriter:
-    """Walks IR models and emits Structured Text into an internal buffer."""
+    """Walks IR models and emits Structured Text into an internal buffer.
 
-    def __init__(self) -> None:
-        self._buf = StringIO()
+    With *collect_variable_names*, ``variable_names`` gathers the interface
+    variable names of every POU written, for the source map.
+    """
+
+    def __init__(self, *, collect_variable_names: bool = False) -> None:
+        self._parts: list[str] = []
         self._indent = 0
         self._indent_str = "    "
+        self._prefix = ""
+        self.variable_names: set[str] | None = set() if collect_variable_names else None
 
     def getvalue(self) -> str:
-        return self._buf.getvalue().rstrip("\n") + "\n"
+        return "".join(self._parts).rstrip("\n") + "\n"
 
     # -- Low-level output helpers -------------------------------------------
 
     def _write(self, text: str) -> None:
-        self._buf.write(text)
+        self._parts.append(text)
 
     def _line(self, text: str = "") -> None:
         if text:
-            self._buf.write(self._indent_str * self._indent + text + "\n")
+            self._parts.append(f"{self._prefix}{text}\n")
         else:
-            self._buf.write("\n")
+            self._parts.append("\n")
 
     def _indent_inc(self) -> None:
         self._indent += 1
+        self._prefix = self._indent_str * self._indent
 
     def _indent_dec(self) -> None:
         self._indent = max(0, self._indent - 1)
+        self._prefix = self._indent_str * self._indent
 
     # ======================================================================
     # Project
@@ -307,6 +314,14 @@ class STWriter:
     # ======================================================================
 
     def write_pou(self, pou: POU) -> None:
+        if self.variable_names is not None:
+            iface = pou.interface
+            for var_list in (
+                iface.input_vars, iface.output_vars, iface.inout_vars,
+                iface.static_vars, iface.temp_vars, iface.constant_vars,
+            ):
+                self.variable_names.update(v.name for v in var_list)
+
         if pou.pou_type == POUType.INTERFACE:
             self._write_interface_pou(pou)
             return
@@ -749,29 +764,48 @@ class STWriter:
 # Source-map helpers
 # ---------------------------------------------------------------------------
 
-def _collect_variable_names(target: Union[Project, POU]) -> set[str]:
-    """Collect all variable names from POU interfaces."""
-    names: set[str] = set()
-    pous = target.pous if isinstance(target, Project) else [target]
-    for pou in pous:
-        iface = pou.interface
-        for var_list in (
-            iface.input_vars, iface.output_vars, iface.inout_vars,
-            iface.static_vars, iface.temp_vars, iface.constant_vars,
-        ):
-            for v in var_list:
-                names.add(v.name)
-    return names
-
-
 _VAR_BLOCK_KEYWORDS = frozenset({
     "VAR_INPUT", "VAR_OUTPUT", "VAR_IN_OUT", "VAR", "VAR_TEMP",
     "VAR CONSTANT", "VAR_GLOBAL",
 })
 
+# A whole declaration block, from its keyword line through END_VAR (or the
+# end of the text if unterminated).
+_VAR_BLOCK_RE = re.compile(
+    r"^[ \t]*(?:" + "|".join(map(re.escape, _VAR_BLOCK_KEYWORDS)) + r")[ \t]*$"
+    r".*?(?:^[ \t]*END_VAR[ \t]*$|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+
+def _blank_var_blocks(st_text: str) -> str:
+    """Replace declaration blocks with empty lines, keeping line numbers."""
+    return _VAR_BLOCK_RE.sub(lambda m: "\n" * m.group().count("\n"), st_text)
+
+
+@functools.lru_cache(maxsize=128)
+def _variable_name_pattern(variable_names: frozenset[str]) -> re.Pattern[str]:
+    """One alternation regex matching any of *variable_names* as a whole word.
+
+    Cached per name set, so re-exporting the same POU reuses the pattern.
+    """
+    # Sort longest-first so the alternation doesn't short-circuit on prefixes
+    sorted_names = sorted(variable_names, key=len, reverse=True)
+    return re.compile(
+        r'\b(' + '|'.join(re.escape(n) for n in sorted_names) + r')\b'
+    )
 
-def _build_source_map(st_text: str, variable_names: set[str]) -> list[dict]:
-    """Scan ST text for variable references, return [{name, line, column}].
+
+class SourceMapEntry(NamedTuple):
+    """One variable reference in emitted ST (1-indexed position)."""
+
+    name: str
+    line: int
+    column: int
+
+
+def _build_source_map(st_text: str, variable_names: set[str]) -> list[SourceMapEntry]:
+    """Scan ST text for variable references, return ``SourceMapEntry`` rows.
 
     Lines and columns are 1-indexed (matching Monaco editor conventions).
     Skips VAR declaration blocks, comment text, and de-duplicates per variable
@@ -780,28 +814,19 @@ def _build_source_map(st_text: str, variable_names: set[str]) -> list[dict]:
     if not variable_names:
         return []
 
-    # Sort longest-first so the alternation doesn't short-circuit on prefixes
-    sorted_names = sorted(variable_names, key=len, reverse=True)
-    pattern = re.compile(
-        r'\b(' + '|'.join(re.escape(n) for n in sorted_names) + r')\b'
-    )
+    # Declaration blocks are blanked in one pass, so every remaining line
+    # is body text.
+    body_lines = _blank_var_blocks(st_text).splitlines()
 
-    entries: list[dict] = []
-    in_var_block = False
+    if len(variable_names) == 1:
+        (name,) = variable_names
+        return _single_name_source_map(body_lines, name)
 
-    for line_num, line_text in enumerate(st_text.splitlines(), start=1):
-        stripped = line_text.strip()
+    pattern = _variable_name_pattern(frozenset(variable_names))
 
-        # Track VAR declaration blocks — skip them entirely
-        if stripped in _VAR_BLOCK_KEYWORDS:
-            in_var_block = True
-            continue
-        if stripped == "END_VAR":
-            in_var_block = False
-            continue
-        if in_var_block:
-            continue
+    entries: list[SourceMapEntry] = []
 
+    for line_num, line_text in enumerate(body_lines, start=1):
         # Strip comment portion before matching
         comment_pos = line_text.find("//")
         searchable = line_text[:comment_pos] if comment_pos >= 0 else line_text
@@ -813,11 +838,31 @@ def _build_source_map(st_text: str, variable_names: set[str]) -> list[dict]:
             if name in seen_on_line:
                 continue
             seen_on_line.add(name)
-            entries.append({
-                "name": name,
-                "line": line_num,
-                "column": match.start() + 1,
-            })
+            entries.append(SourceMapEntry(name, line_num, match.start() + 1))
+    return entries
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _single_name_source_map(body_lines: list[str], name: str) -> list[SourceMapEntry]:
+    """``_build_source_map`` for one name: ``str.find`` plus manual word
+    boundary checks, which beats driving the regex engine per line.
+    """
+    entries: list[SourceMapEntry] = []
+    size = len(name)
+    for line_num, line_text in enumerate(body_lines, start=1):
+        comment_pos = line_text.find("//")
+        end = comment_pos if comment_pos >= 0 else len(line_text)
+        pos = line_text.find(name, 0, end)
+        while pos >= 0:
+            after = pos + size
+            if ((pos == 0 or not _is_word_char(line_text[pos - 1]))
+                    and (after == end or not _is_word_char(line_text[after]))):
+                entries.append(SourceMapEntry(name, line_num, pos + 1))
+                break
+            pos = line_text.find(name, pos + 1, end)
     return entries
 
 
@@ -96,6 +96,7 @@ from ._compiler import (
     count_up,
     count_down,
     CompileError,
+    CompileErrorCode,
 )
 
 from ._discover import (
@@ -184,6 +185,7 @@ __all__ = [
     "CompiledGlobalVarList",
     # Errors
     "CompileError",
+    "CompileErrorCode",
     # Discovery
     "discover",
     "DiscoveryResult",
@@ -8,12 +8,18 @@ from __future__ import annotations
 
 import ast
 import inspect
-import textwrap
 from typing import Any
 
+from plx.model.pou import POU
 from plx.model.types import TypeRef
 
-from ._compiler import CompileContext, CompileError
+from ._compiler import (
+    CompileContext,
+    CompileError,
+    CompileErrorCode,
+    function_source,
+    parse_source,
+)
 from ._descriptors import VarDirection
 from ._protocols import CompiledEnum
 
@@ -47,11 +53,13 @@ def _parse_function_source(
     -------
     tuple of (func_def, source, start_lineno)
     """
-    source_lines, start_lineno = inspect.getsourcelines(func)
-    source = textwrap.dedent("".join(source_lines))
+    if validate_self_only:
+        _validate_self_only(func, context_name)
+
+    source, start_lineno = function_source(func)
 
     try:
-        tree = ast.parse(source)
+        tree = parse_source(source)
     except SyntaxError as e:
         raise CompileError(
             f"Syntax error in {context_name}: {e}"
@@ -64,17 +72,6 @@ def _parse_function_source(
 
     func_def = tree.body[0]
 
-    if validate_self_only:
-        params = func_def.args
-        if len(params.args) != 1 or params.args[0].arg != "self":
-            raise CompileError(
-                f"{context_name} must take exactly one parameter (self)"
-            )
-        if params.vararg or params.kwarg or params.kwonlyargs or params.posonlyargs:
-            raise CompileError(
-                f"{context_name} must take only 'self'"
-            )
-
     if validate_single_return:
         body = func_def.body
         if len(body) != 1 or not isinstance(body[0], ast.Return):
@@ -90,6 +87,27 @@ def _parse_function_source(
     return func_def, source, start_lineno
 
 
+def _validate_self_only(func: Any, context_name: str) -> None:
+    """Check that *func* takes exactly ``(self)``.
+
+    Reads the code object of the unwrapped function directly, so a bad
+    signature is rejected before any source is read or parsed.
+    """
+    code = inspect.unwrap(func).__code__
+    n_posonly = code.co_posonlyargcount
+    if code.co_argcount - n_posonly != 1 or code.co_varnames[n_posonly] != "self":
+        raise CompileError(
+            f"{context_name} must take exactly one parameter (self)",
+            code=CompileErrorCode.LOGIC_ARITY,
+        )
+    if (code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+            or code.co_kwonlyargcount or n_posonly):
+        raise CompileError(
+            f"{context_name} must take only 'self'",
+            code=CompileErrorCode.MUST_TAKE_SELF_ONLY,
+        )
+
+
 # ---------------------------------------------------------------------------
 # CompileContext construction
 # ---------------------------------------------------------------------------
@@ -132,6 +150,15 @@ def _build_compile_context(
     )
 
 
+# ---------------------------------------------------------------------------
+# Compiled POU accessor
+# ---------------------------------------------------------------------------
+
+def _compiled_pou(klass: type) -> POU:
+    """``compile()`` for POU classes — the IR is built once at decoration."""
+    return klass._compiled_pou
+
+
 # ---------------------------------------------------------------------------
 # Enum discovery
 # ---------------------------------------------------------------------------
@@ -20,8 +20,14 @@ Key concepts:
 from __future__ import annotations
 
 import ast
+import functools
+import inspect
+import linecache
 import re
+import textwrap
 from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
 
 from plx.model.expressions import (
     BinaryOp,
@@ -47,10 +53,36 @@ from ._descriptors import VarDirection
 # CompileError
 # ---------------------------------------------------------------------------
 
+class CompileErrorCode(str, Enum):
+    """Stable identifiers for class-level compile errors.
+
+    Lets callers branch on the failure without matching message text.
+    """
+
+    NO_LOGIC = "NO_LOGIC"
+    LOGIC_ARITY = "LOGIC_ARITY"
+    MUST_TAKE_SELF_ONLY = "MUST_TAKE_SELF_ONLY"
+    MISSING_RETURN_TYPE = "MISSING_RETURN_TYPE"
+    SFC_LANGUAGE = "SFC_LANGUAGE"
+    INVALID_LANGUAGE = "INVALID_LANGUAGE"
+
+
 class CompileError(Exception):
-    """Error during AST compilation with source location."""
+    """Error during AST compilation with source location.
+
+    ``code`` is a ``CompileErrorCode`` for errors that have one, else
+    ``None``.
+    """
 
-    def __init__(self, message: str, node: ast.AST | None = None, ctx: CompileContext | None = None):
+    def __init__(
+        self,
+        message: str,
+        node: ast.AST | None = None,
+        ctx: CompileContext | None = None,
+        *,
+        code: CompileErrorCode | None = None,
+    ):
+        self.code = code
         self.source_file = "<unknown>"
         self.source_line: int | None = None
         if node is not None and ctx is not None:
@@ -68,7 +100,7 @@ class CompileError(Exception):
 # CompileContext
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CompileContext:
     """Mutable state carried through compilation."""
 
@@ -288,6 +320,81 @@ def resolve_annotation(
     raise CompileError(msg, node, ctx)
 
 
+# ---------------------------------------------------------------------------
+# Source parsing (shared by compiler + decorators)
+# ---------------------------------------------------------------------------
+
+def function_source(func: Any) -> tuple[str, int]:
+    """Return ``(dedented_source, start_lineno)`` for *func*.
+
+    Cached on the function object, so a parent ``logic()`` inlined by
+    several subclasses via ``super().logic()`` is only read once.
+    """
+    cached = getattr(func, "_plx_source", None)
+    if cached is None:
+        source_lines, start_lineno = _function_source_lines(func)
+        cached = (_dedent_block(source_lines), start_lineno)
+        try:
+            func._plx_source = cached
+        except AttributeError:
+            pass  # builtins / bound methods don't take attributes
+    return cached
+
+
+def _function_source_lines(func: Any) -> tuple[list[str], int]:
+    """``inspect.getsourcelines`` for plain functions, minus its overhead.
+
+    Slices the function's block straight out of ``linecache`` using the
+    code object's file and first line.  Like ``inspect``, it follows
+    ``__wrapped__`` first.  Anything else (no code object, source not in
+    the cache) goes through ``inspect``, which also produces the usual
+    ``OSError`` when source is unavailable.
+    """
+    func = inspect.unwrap(func)
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        filename = code.co_filename
+        linecache.checkcache(filename)
+        lines = linecache.getlines(filename, getattr(func, "__globals__", None))
+        start_lineno = code.co_firstlineno
+        if 0 < start_lineno <= len(lines):
+            return inspect.getblock(lines[start_lineno - 1:]), start_lineno
+    return inspect.getsourcelines(func)
+
+
+def _dedent_block(lines: list[str]) -> str:
+    """``textwrap.dedent`` specialised for a source block.
+
+    The first line (``def`` or a decorator) carries the block's margin,
+    so when every non-blank line starts with that indent it is sliced
+    off directly.  Anything irregular (e.g. a multi-line string that
+    dips below the margin) falls back to ``textwrap.dedent``.
+    """
+    first = lines[0]
+    margin = len(first) - len(first.lstrip(" \t"))
+    prefix = first[:margin]
+    out: list[str] = []
+    for line in lines:
+        if not line.strip():
+            # dedent normalises whitespace-only lines to a bare newline
+            out.append("\n" if line.endswith("\n") else "")
+        elif line.startswith(prefix):
+            out.append(line[margin:])
+        else:
+            return textwrap.dedent("".join(lines))
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_source(source: str) -> ast.Module:
+    """``ast.parse`` cached by source string.
+
+    The compiler only reads the tree, so one tree is shared between
+    callers — do not mutate it.
+    """
+    return ast.parse(source)
+
+
 # ---------------------------------------------------------------------------
 # ASTCompiler — composed from mixins
 # ---------------------------------------------------------------------------
@@ -326,20 +433,22 @@ class ASTCompiler(_StatementMixin, _ExpressionMixin, _SentinelMixin):
 
     def _compile_statement(self, node: ast.stmt) -> list[Statement]:
         """Compile a single AST statement node into IR statements."""
-        # Check rejected nodes first
-        if type(node) in _REJECTED_NODES:
-            raise CompileError(_REJECTED_NODES[type(node)], node, self.ctx)
-
-        handler = self._STATEMENT_HANDLERS.get(type(node))
+        # Handled and rejected node types are disjoint, so the rejection
+        # table is only consulted on a miss.
+        node_type = type(node)
+        handler = self._STATEMENT_HANDLERS.get(node_type)
         if handler is None:
+            reason = _REJECTED_NODES.get(node_type)
+            if reason is not None:
+                raise CompileError(reason, node, self.ctx)
             raise CompileError(
-                f"Unsupported Python syntax: {type(node).__name__}. "
+                f"Unsupported Python syntax: {node_type.__name__}. "
                 f"PLC logic supports a subset of Python.",
                 node, self.ctx,
             )
         result = handler(self, node)
         assert not self.ctx.pending_fb_invocations, (
-            f"Unflushed pending_fb_invocations after {type(node).__name__}. "
+            f"Unflushed pending_fb_invocations after {node_type.__name__}. "
             f"Handler must call _flush_pending()."
         )
         return result
@@ -350,14 +459,15 @@ class ASTCompiler(_StatementMixin, _ExpressionMixin, _SentinelMixin):
 
     def compile_expression(self, node: ast.expr) -> Expression:
         """Compile a single AST expression node into an IR expression."""
-        # Check rejected nodes
-        if type(node) in _REJECTED_NODES:
-            raise CompileError(_REJECTED_NODES[type(node)], node, self.ctx)
-
-        handler = self._EXPRESSION_HANDLERS.get(type(node))
+        # Rejections are only looked up on a miss (see _compile_statement).
+        node_type = type(node)
+        handler = self._EXPRESSION_HANDLERS.get(node_type)
         if handler is None:
+            reason = _REJECTED_NODES.get(node_type)
+            if reason is not None:
+                raise CompileError(reason, node, self.ctx)
             raise CompileError(
-                f"Unsupported Python syntax: {type(node).__name__}. "
+                f"Unsupported Python syntax: {node_type.__name__}. "
                 f"PLC logic supports a subset of Python.",
                 node, self.ctx,
             )
@@ -35,6 +35,19 @@ if TYPE_CHECKING:
     from ._compiler import ASTCompiler
 
 
+def _fb_instance_var(instance_name: str, fb_type: str) -> Variable:
+    """Generated static var for a sentinel's FB instance.
+
+    The name is auto-generated and *fb_type* is one of the standard FBs
+    the sentinels expand to, so the variable is built without
+    re-validation.  Each call gets its own type ref.
+    """
+    return Variable.model_construct(
+        name=instance_name,
+        data_type=NamedTypeRef(name=fb_type),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Duration helper
 # ---------------------------------------------------------------------------
@@ -115,10 +128,7 @@ class _SentinelMixin:
         instance_name = self.ctx.next_auto_name(fb_type.lower())
 
         # Add to generated static vars
-        self.ctx.generated_static_vars.append(Variable(
-            name=instance_name,
-            data_type=NamedTypeRef(name=fb_type),
-        ))
+        self.ctx.generated_static_vars.append(_fb_instance_var(instance_name, fb_type))
 
         # Add FBInvocation to pending
         self.ctx.pending_fb_invocations.append(FBInvocation(
@@ -145,10 +155,7 @@ class _SentinelMixin:
         instance_name = self.ctx.next_auto_name(fb_type.lower())
 
         # Add to generated static vars
-        self.ctx.generated_static_vars.append(Variable(
-            name=instance_name,
-            data_type=NamedTypeRef(name=fb_type),
-        ))
+        self.ctx.generated_static_vars.append(_fb_instance_var(instance_name, fb_type))
 
         # Add FBInvocation to pending
         self.ctx.pending_fb_invocations.append(FBInvocation(
@@ -192,10 +199,7 @@ class _SentinelMixin:
 
         instance_name = self.ctx.next_auto_name(fb_type.lower())
 
-        self.ctx.generated_static_vars.append(Variable(
-            name=instance_name,
-            data_type=NamedTypeRef(name=fb_type),
-        ))
+        self.ctx.generated_static_vars.append(_fb_instance_var(instance_name, fb_type))
 
         inputs = {count_input: signal, pv_input: preset_expr}
 
@@ -49,6 +49,8 @@ from ._compiler import (
     _BINOP_MAP,
     _SYSTEM_FLAG_SENTINELS,
     _TIMER_SENTINELS,
+    function_source,
+    parse_source,
     resolve_annotation,
 )
 from ._descriptors import VarDirection
@@ -191,27 +193,15 @@ class _StatementMixin:
         args = node.iter.args
         if len(args) == 1:
             from_expr = LiteralExpr(value="0")
-            to_expr = BinaryExpr(
-                op=BinaryOp.SUB,
-                left=self.compile_expression(args[0]),
-                right=LiteralExpr(value="1"),
-            )
+            to_expr = self._compile_range_stop(args[0])
             by_expr = None
         elif len(args) == 2:
             from_expr = self.compile_expression(args[0])
-            to_expr = BinaryExpr(
-                op=BinaryOp.SUB,
-                left=self.compile_expression(args[1]),
-                right=LiteralExpr(value="1"),
-            )
+            to_expr = self._compile_range_stop(args[1])
             by_expr = None
         elif len(args) == 3:
             from_expr = self.compile_expression(args[0])
-            to_expr = BinaryExpr(
-                op=BinaryOp.SUB,
-                left=self.compile_expression(args[1]),
-                right=LiteralExpr(value="1"),
-            )
+            to_expr = self._compile_range_stop(args[1])
             by_expr = self.compile_expression(args[2])
         else:
             raise CompileError("range() takes 1-3 arguments", node, self.ctx)
@@ -233,6 +223,20 @@ class _StatementMixin:
             body=body,
         )]
 
+    def _compile_range_stop(self, stop: ast.expr) -> Expression:
+        """Inclusive FOR upper bound for an exclusive ``range()`` stop.
+
+        An integer literal stop folds to ``stop - 1`` at compile time;
+        anything else emits the subtraction.
+        """
+        if isinstance(stop, ast.Constant) and type(stop.value) is int:
+            return LiteralExpr(value=str(stop.value - 1))
+        return BinaryExpr(
+            op=BinaryOp.SUB,
+            left=self.compile_expression(stop),
+            right=LiteralExpr(value="1"),
+        )
+
     def _compile_while(self, node: ast.While) -> list[Statement]:
         cond, pending = self._compile_expr_and_flush(node.test)
         body = self._compile_body_list(node.body)
@@ -403,9 +407,6 @@ class _StatementMixin:
         that auto-generated instance names (``__ton_0``, etc.) continue
         from where the child left off — no renaming needed.
         """
-        import inspect as _inspect
-        import textwrap as _textwrap
-
         if self.ctx.pou_class is None:
             raise CompileError(
                 "super().logic() used but no class context available",
@@ -430,9 +431,8 @@ class _StatementMixin:
 
         # Get parent's logic source
         logic_method = parent_class.__dict__["logic"]
-        source_lines, start_lineno = _inspect.getsourcelines(logic_method)
-        source = _textwrap.dedent("".join(source_lines))
-        tree = ast.parse(source)
+        source, start_lineno = function_source(logic_method)
+        tree = parse_source(source)
 
         if not tree.body or not isinstance(tree.body[0], ast.FunctionDef):
             raise CompileError(
@@ -43,6 +43,11 @@ from ._descriptors import _format_initial
 from ._types import _resolve_type_ref
 
 
+def _compiled_type(klass: type) -> StructType | EnumType:
+    """``compile()`` for data types — the IR is built once at decoration."""
+    return klass._compiled_type
+
+
 # ---------------------------------------------------------------------------
 # @struct decorator
 # ---------------------------------------------------------------------------
@@ -82,12 +87,7 @@ def struct(cls: type | None = None, *, folder: str = "") -> Any:
         compiled = StructType(name=cls.__name__, members=members, folder=folder)
         cls._compiled_type = compiled
         cls.__plx_struct__ = True
-
-        @classmethod  # type: ignore[misc]
-        def compile(klass: type) -> StructType:
-            return klass._compiled_type
-
-        cls.compile = compile
+        cls.compile = classmethod(_compiled_type)
         return cls
 
     if cls is not None:
@@ -156,12 +156,7 @@ def enumeration(
         cls._compiled_type = compiled
         cls._enum_values = enum_values
         cls.__plx_enum__ = True
-
-        @classmethod  # type: ignore[misc]
-        def compile(klass: type) -> EnumType:
-            return klass._compiled_type
-
-        cls.compile = compile
+        cls.compile = classmethod(_compiled_type)
         return cls
 
     if cls is not None:
@@ -29,9 +29,16 @@ from plx.model.pou import (
 from plx.model.types import TypeRef
 from plx.model.variables import Variable
 
-from ._compiler import ASTCompiler, CompileContext, CompileError, resolve_annotation
+from ._compiler import (
+    ASTCompiler,
+    CompileContext,
+    CompileError,
+    CompileErrorCode,
+    resolve_annotation,
+)
 from ._compilation_helpers import (
     _build_compile_context,
+    _compiled_pou,
     _discover_enums,
     _parse_function_source,
 )
@@ -43,7 +50,7 @@ from ._protocols import CompiledPOU
 # @method decorator
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _MethodMarker:
     """Stored as ``func._plx_marker`` on @method-decorated functions."""
     access: AccessSpecifier
@@ -211,14 +218,16 @@ def _validate_language(language: str | None) -> Language | None:
     if language == "SFC":
         raise CompileError(
             "language='SFC' is not supported on @fb/@program/@function. "
-            "Use @sfc instead."
+            "Use @sfc instead.",
+            code=CompileErrorCode.SFC_LANGUAGE,
         )
     try:
         return Language(language)
     except ValueError:
         valid = ", ".join(f'"{v.value}"' for v in Language)
         raise CompileError(
-            f"Invalid language '{language}'. Valid options: {valid}"
+            f"Invalid language '{language}'. Valid options: {valid}",
+            code=CompileErrorCode.INVALID_LANGUAGE,
         ) from None
 
 
@@ -368,7 +377,8 @@ def _parse_logic_source(cls: type) -> tuple[ast.FunctionDef, str, int]:
     """
     if not hasattr(cls, "logic"):
         raise CompileError(
-            f"POU class '{cls.__name__}' must have a logic() method"
+            f"POU class '{cls.__name__}' must have a logic() method",
+            code=CompileErrorCode.NO_LOGIC,
         )
 
     return _parse_function_source(
@@ -378,6 +388,12 @@ def _parse_logic_source(cls: type) -> tuple[ast.FunctionDef, str, int]:
     )
 
 
+def _is_pass_only(func_def: ast.FunctionDef, source: str) -> bool:
+    """True if the body is a lone ``pass`` with no comments to carry over."""
+    body = func_def.body
+    return len(body) == 1 and isinstance(body[0], ast.Pass) and "#" not in source
+
+
 def _compile_logic_networks(
     func_def: ast.FunctionDef,
     ctx: CompileContext,
@@ -434,7 +450,8 @@ def _compile_pou_class(
         if func_def.returns is None:
             raise CompileError(
                 f"FUNCTION '{cls.__name__}' requires a return type — "
-                f"annotate logic(): def logic(self) -> REAL:"
+                f"annotate logic(): def logic(self) -> REAL:",
+                code=CompileErrorCode.MISSING_RETURN_TYPE,
             )
         return_type = resolve_annotation(
             func_def.returns,
@@ -446,21 +463,30 @@ def _compile_pou_class(
     except (TypeError, OSError):
         source_file = "<unknown>"
 
-    ctx = _build_compile_context(
-        cls.logic, cls,
-        declared_vars, static_var_types,
-        start_lineno, source_file,
-    )
+    if _is_pass_only(func_def, source):
+        # Interface-only classes: nothing to compile or generate, so skip
+        # context setup, comment tokenizing and statement dispatch.
+        networks = [Network()]
+        generated_static: list[Variable] = []
+        generated_temp: list[Variable] = []
+    else:
+        ctx = _build_compile_context(
+            cls.logic, cls,
+            declared_vars, static_var_types,
+            start_lineno, source_file,
+        )
+        networks = _compile_logic_networks(func_def, ctx, source)
+        generated_static = ctx.generated_static_vars
+        generated_temp = ctx.generated_temp_vars
 
-    networks = _compile_logic_networks(func_def, ctx, source)
     compiled_methods = _compile_all_methods(cls, declared_vars, static_var_types, source_file)
 
     interface = POUInterface(
         input_vars=var_groups["input"],
         output_vars=var_groups["output"],
         inout_vars=var_groups["inout"],
-        static_vars=var_groups["static"] + ctx.generated_static_vars,
-        temp_vars=var_groups["temp"] + ctx.generated_temp_vars,
+        static_vars=var_groups["static"] + generated_static,
+        temp_vars=var_groups["temp"] + generated_temp,
         constant_vars=var_groups["constant"],
     )
 
@@ -477,12 +503,7 @@ def _compile_pou_class(
     )
 
     cls._compiled_pou = pou
-
-    @classmethod
-    def compile(klass: type) -> POU:
-        return klass._compiled_pou
-
-    cls.compile = compile
+    cls.compile = classmethod(_compiled_pou)
 
     return cls
 
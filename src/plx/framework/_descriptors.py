@@ -13,7 +13,9 @@ Users declare variables on their POU classes like::
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from enum import Enum
+from typing import Any
 
 from plx.model.types import PrimitiveType, TypeRef
 from plx.model.variables import Variable
@@ -47,6 +49,7 @@ class VarDescriptor:
         self,
         direction: VarDirection,
         data_type: TypeRef,
+        *,
         initial_value: str | None = None,
         description: str = "",
         retain: bool = False,
@@ -64,13 +67,39 @@ class VarDescriptor:
         self.address = address
 
 
+def _format_bool(value: bool) -> str:
+    return "TRUE" if value else "FALSE"
+
+
+def _format_none(value: None) -> None:
+    return None
+
+
+def _format_str(value: str) -> str:
+    return value
+
+
+# Exact-type fast path for _format_initial; subclasses (IntEnum members,
+# str enums, ...) fall through to the isinstance chain.
+_INITIAL_FORMATTERS: dict[type, Callable[[Any], str | None]] = {
+    type(None): _format_none,
+    bool: _format_bool,
+    int: str,
+    float: str,
+    str: _format_str,
+    TimeLiteral: TimeLiteral.to_iec,
+    LTimeLiteral: LTimeLiteral.to_iec,
+}
+
+
 def _format_initial(value: object) -> str | None:
     """Convert a Python value to an IEC 61131-3 literal string.
 
     Returns ``None`` if the value is ``None``.
     """
-    if value is None:
-        return None
+    formatter = _INITIAL_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
     if isinstance(value, bool):
         return "TRUE" if value else "FALSE"
     if isinstance(value, (int, float)):
@@ -220,30 +249,11 @@ def _collect_descriptors(cls: type, *, own_only: bool = False) -> dict[str, list
     }
 
     if own_only:
-        sources = [cls.__dict__]
+        collected = _scan_descriptors([cls.__dict__])
     else:
-        # Walk MRO in reverse so parent attrs come first and child
-        # overrides replace them via the ``seen`` set.
-        sources = [
-            base.__dict__
-            for base in reversed(cls.__mro__)
-            if base is not object
-        ]
-
-    seen: set[str] = set()
-    collected: list[tuple[str, VarDescriptor]] = []
+        collected = _merged_descriptors(cls)
 
-    for ns in sources:
-        for attr_name, value in ns.items():
-            if not isinstance(value, VarDescriptor):
-                continue
-            if attr_name in seen:
-                # Child overrides parent — remove the earlier entry
-                collected = [(n, v) for n, v in collected if n != attr_name]
-            seen.add(attr_name)
-            collected.append((attr_name, value))
-
-    for attr_name, desc in collected:
+    for attr_name, desc in collected.items():
         var = Variable(
             name=attr_name,
             data_type=desc.data_type,
@@ -257,3 +267,40 @@ def _collect_descriptors(cls: type, *, own_only: bool = False) -> dict[str, list
         groups[desc.direction].append(var)
 
     return groups
+
+
+def _scan_descriptors(namespaces: list) -> dict[str, VarDescriptor]:
+    """Merge the ``VarDescriptor`` entries of *namespaces*, later ones winning."""
+    # Insertion-ordered: popping before re-inserting moves an overridden
+    # name to the later position, as if the earlier entry were removed.
+    collected: dict[str, VarDescriptor] = {}
+    for ns in namespaces:
+        for attr_name, value in ns.items():
+            if isinstance(value, VarDescriptor):
+                collected.pop(attr_name, None)
+                collected[attr_name] = value
+    return collected
+
+
+def _merged_descriptors(cls: type) -> dict[str, VarDescriptor]:
+    """Descriptors visible on *cls* through its MRO, parents first.
+
+    The result is frozen onto the class as ``_plx_descriptors``.  A
+    single-inheritance child of an already-collected POU starts from
+    that tuple and only scans its own namespace; anything else walks
+    the full MRO.
+    """
+    bases = cls.__bases__
+    parent = bases[0].__dict__.get("_plx_descriptors") if len(bases) == 1 else None
+    if parent is not None:
+        collected = _scan_descriptors([dict(parent), cls.__dict__])
+    else:
+        # Walk MRO in reverse so parent attrs come first and child
+        # overrides replace them.
+        collected = _scan_descriptors([
+            base.__dict__
+            for base in reversed(cls.__mro__)
+            if base is not object
+        ])
+    cls._plx_descriptors = tuple(collected.items())
+    return collected
@@ -29,6 +29,25 @@ class DiscoveryResult:
         self.global_var_lists: list[type] = []
         self.tasks: list[PlxTask] = []
 
+    # Name lookups are built from the lists on each access, so they never
+    # go stale if a caller edits a result; hold on to the dict for repeated
+    # lookups.
+
+    @property
+    def pous_by_name(self) -> dict[str, type]:
+        """Discovered POU classes keyed by class name."""
+        return {cls.__name__: cls for cls in self.pous}
+
+    @property
+    def data_types_by_name(self) -> dict[str, type]:
+        """Discovered data type classes keyed by class name."""
+        return {cls.__name__: cls for cls in self.data_types}
+
+    @property
+    def gvls_by_name(self) -> dict[str, type]:
+        """Discovered global variable list classes keyed by class name."""
+        return {cls.__name__: cls for cls in self.global_var_lists}
+
 
 def _infer_folder(cls_or_obj: Any, root_package: str) -> str:
     """Infer a folder path from the object's module relative to root_package.
@@ -40,38 +59,44 @@ def _infer_folder(cls_or_obj: Any, root_package: str) -> str:
     - Root-level module (``my_machine.types``): → ``""``
     - Root package itself (``my_machine``): → ``""``
     """
-    module_name: str = getattr(cls_or_obj, "__module__", "")
-    if not module_name or not module_name.startswith(root_package):
+    module_name: str = getattr(cls_or_obj, "__module__", "") or ""
+    # Also rejects the root itself (defined in the root __init__.py) and
+    # sibling packages that merely share the prefix (``my_machine2``).
+    if not module_name.startswith(root_package + "."):
         return ""
 
-    # Strip root package prefix
-    relative = module_name[len(root_package):]
-    if relative.startswith("."):
-        relative = relative[1:]
+    relative = module_name[len(root_package) + 1:]
+
+    # Package __init__.py keeps all parts; a regular module drops the last
+    # segment (the filename).
+    if not _is_package(sys.modules.get(module_name)):
+        relative = relative.rpartition(".")[0]
+    return relative.replace(".", "/")
 
-    if not relative:
-        # Defined in root package __init__.py
-        return ""
 
-    parts = relative.split(".")
+def _is_package(mod: ModuleType | None) -> bool:
+    """True if *mod* is a package (as opposed to a plain module file)."""
+    if mod is None:
+        return False
+    # Imported modules record this on their spec; hand-built ones
+    # (``ModuleType(...)`` with ``__spec__ = None``) only have ``__path__``.
+    spec = getattr(mod, "__spec__", None)
+    if spec is not None:
+        return spec.submodule_search_locations is not None
+    return hasattr(mod, "__path__")
 
-    # Check if the module is a package (__init__.py) vs a regular .py file
-    mod = sys.modules.get(module_name)
-    is_package = mod is not None and hasattr(mod, "__path__")
 
-    if is_package:
-        # Package __init__.py → keep all parts
-        return "/".join(parts)
-    else:
-        # Regular module → drop last segment (the filename)
-        if len(parts) <= 1:
-            return ""
-        return "/".join(parts[:-1])
+def _import(name: str) -> ModuleType:
+    """``importlib.import_module``, skipping the import machinery on a hit."""
+    mod = sys.modules.get(name)
+    if mod is None:
+        mod = importlib.import_module(name)
+    return mod
 
 
 def _walk_package(package_name: str) -> list[ModuleType]:
     """Import a package and all its submodules, return as a flat list."""
-    root = importlib.import_module(package_name)
+    root = _import(package_name)
     modules = [root]
 
     if not hasattr(root, "__path__"):
@@ -82,7 +107,7 @@ def _walk_package(package_name: str) -> list[ModuleType]:
         root.__path__, prefix=package_name + "."
     ):
         try:
-            mod = importlib.import_module(modname)
+            mod = _import(modname)
             modules.append(mod)
         except Exception:
             # Skip modules that fail to import
@@ -40,6 +40,7 @@ from plx.model.variables import Variable
 from ._compiler import ASTCompiler, CompileContext, CompileError
 from ._compilation_helpers import (
     _build_compile_context,
+    _compiled_pou,
     _discover_enums,
     _parse_function_source,
 )
@@ -126,7 +127,7 @@ class StepGroup:
 # Marker dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ActionMarker:
     """Stored as ``func._plx_marker`` on step action methods."""
     step_desc: StepDescriptor
@@ -136,7 +137,7 @@ class _ActionMarker:
     action_name: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _TransitionMarker:
     """Stored as ``func._plx_marker`` on transition methods."""
     path: TransitionPath
@@ -540,12 +541,7 @@ def _compile_sfc_class(cls: type, pou_type: POUType, folder: str = "") -> type:
     )
 
     cls._compiled_pou = pou
-
-    @classmethod
-    def compile(klass: type) -> POU:
-        return klass._compiled_pou
-
-    cls.compile = compile
+    cls.compile = classmethod(_compiled_pou)
 
     return cls
 
@@ -287,7 +287,7 @@ def _resolve_type_ref(type_arg: PrimitiveType | TypeRef | str) -> TypeRef:
     - str → NamedTypeRef(name=...)
     """
     if isinstance(type_arg, PrimitiveType):
-        return PrimitiveTypeRef(type=type_arg)
+        return PrimitiveTypeRef.model_construct(type=type_arg)
     if isinstance(type_arg, (
         PrimitiveTypeRef, StringTypeRef, NamedTypeRef,
         ArrayTypeRef, PointerTypeRef, ReferenceTypeRef,
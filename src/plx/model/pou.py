@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Self
+from typing import Any, Self
 
 from pydantic import BaseModel, model_validator
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the ``fast`` extra
+    orjson = None
+
 from .sfc import SFCBody
 from .statements import Statement
 from .types import TypeRef
@@ -138,3 +143,14 @@ class POU(BaseModel):
     def _body_exclusivity(self) -> Self:
         _check_body_exclusivity(self.networks, self.sfc_body, "POU")
         return self
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize to JSON, encoding with orjson when it is installed.
+
+        Only the default (no-option) call takes the orjson path; any
+        keyword argument defers to pydantic so ``indent``, ``exclude``
+        and friends keep their usual meaning.
+        """
+        if orjson is None or kwargs:
+            return super().model_dump_json(**kwargs)
+        return orjson.dumps(self.model_dump(mode="json")).decode()
@@ -49,7 +49,7 @@ class CaseBranch(BaseModel):
     or falls within any range in *ranges*.
     """
 
-    values: list[int] = []
+    values: tuple[int, ...] = ()
     ranges: list[CaseRange] = []
     body: list[Statement] = []
 
@@ -7,6 +7,7 @@ provides attribute-style access to POU variables.
 from __future__ import annotations
 
 import math
+import sys
 
 from plx.model.pou import POU
 from plx.model.types import (
@@ -90,6 +91,18 @@ class SimulationContext:
         # Track temp var definitions for fresh allocation each scan
         object.__setattr__(self, "_temp_vars", list(pou.interface.temp_vars))
 
+        # One engine for the lifetime of the context — per-POU lookup
+        # tables it builds on the first scan are reused by later scans
+        engine = ExecutionEngine(
+            pou=pou,
+            state=state,
+            clock_ms=0,
+            pou_registry=self._pou_registry,
+            data_type_registry=self._data_type_registry,
+            enum_registry=self._enum_registry,
+        )
+        object.__setattr__(self, "_engine", engine)
+
     # -----------------------------------------------------------------------
     # State allocation
     # -----------------------------------------------------------------------
@@ -107,8 +120,10 @@ class SimulationContext:
             + list(pou.interface.constant_vars)
         )
 
+        # Interned keys let lookups by (also interned) identifier names
+        # short-circuit on identity instead of comparing string contents
         for var in all_vars:
-            state[var.name] = self._allocate_var(var)
+            state[sys.intern(var.name)] = self._allocate_var(var)
 
         return state
 
@@ -180,20 +195,21 @@ class SimulationContext:
         """Allocate a struct as a dict of member defaults."""
         result: dict[str, object] = {}
         for member in typedef.members:
+            name = sys.intern(member.name)
             if member.initial_value is not None:
-                result[member.name] = parse_literal(
+                result[name] = parse_literal(
                     member.initial_value, member.data_type, self._enum_registry,
                 )
             else:
                 default = type_default(member.data_type)
                 if default is not None:
-                    result[member.name] = default
+                    result[name] = default
                 elif isinstance(member.data_type, NamedTypeRef):
-                    result[member.name] = self._allocate_named(member.data_type.name)
+                    result[name] = self._allocate_named(member.data_type.name)
                 elif isinstance(member.data_type, ArrayTypeRef):
-                    result[member.name] = self._allocate_array(member.data_type)
+                    result[name] = self._allocate_array(member.data_type)
                 else:
-                    result[member.name] = 0
+                    result[name] = 0
         return result
 
     # -----------------------------------------------------------------------
@@ -214,14 +230,8 @@ class SimulationContext:
                 self._state[var.name] = self._allocate_var(var)
 
             # Execute
-            engine = ExecutionEngine(
-                pou=self._pou,
-                state=self._state,
-                clock_ms=self._clock_ms,
-                pou_registry=self._pou_registry,
-                data_type_registry=self._data_type_registry,
-                enum_registry=self._enum_registry,
-            )
+            engine = self._engine
+            engine.clock_ms = self._clock_ms
             engine.execute()
 
             # Clear first-scan flag after the first scan
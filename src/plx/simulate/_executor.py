@@ -7,6 +7,7 @@ arrays are lists.
 
 from __future__ import annotations
 
+import operator
 from collections.abc import Callable
 
 from plx.model.expressions import (
@@ -39,11 +40,71 @@ from plx.model.statements import (
     Statement,
     WhileStatement,
 )
+from plx.model.types import PrimitiveType, PrimitiveTypeRef
 
 from ._builtins import BUILTIN_FBS, STDLIB_FUNCTIONS
 from ._values import SimulationError, coerce_type, parse_literal, type_default
 
 
+# Single-bit masks for bit access (.0 .. .63), indexed by bit number
+_BIT_MASKS: tuple[int, ...] = tuple(1 << i for i in range(64))
+
+
+# ---------------------------------------------------------------------------
+# Binary operators
+# ---------------------------------------------------------------------------
+
+def _div(left: object, right: object) -> object:
+    if isinstance(left, float) or isinstance(right, float):
+        return left / right
+    # IEC integer division: truncate toward zero
+    return int(left / right)
+
+
+def _shl(left: object, right: object) -> int:
+    return int(left) << int(right)
+
+
+def _shr(left: object, right: object) -> int:
+    return int(left) >> int(right)
+
+
+def _rol(left: object, right: object) -> int:
+    value, n = int(left) & 0xFFFFFFFF, int(right) % 32
+    return ((value << n) | (value >> (32 - n))) & 0xFFFFFFFF
+
+
+def _ror(left: object, right: object) -> int:
+    value, n = int(left) & 0xFFFFFFFF, int(right) % 32
+    return ((value >> n) | (value << (32 - n))) & 0xFFFFFFFF
+
+
+# One lookup per operation instead of walking an if-ladder.  AND/OR/XOR
+# map to the bitwise operators: on two bools they yield the same bool as
+# the logical forms, and on integers they are the IEC bitwise ops.
+_BINOP_FUNCS: dict[BinaryOp, Callable[[object, object], object]] = {
+    BinaryOp.ADD: operator.add,
+    BinaryOp.SUB: operator.sub,
+    BinaryOp.MUL: operator.mul,
+    BinaryOp.DIV: _div,
+    BinaryOp.MOD: operator.mod,
+    BinaryOp.EXPT: operator.pow,
+    BinaryOp.AND: operator.and_,
+    BinaryOp.OR: operator.or_,
+    BinaryOp.XOR: operator.xor,
+    BinaryOp.EQ: operator.eq,
+    BinaryOp.NE: operator.ne,
+    BinaryOp.GT: operator.gt,
+    BinaryOp.GE: operator.ge,
+    BinaryOp.LT: operator.lt,
+    BinaryOp.LE: operator.le,
+    BinaryOp.SHL: _shl,
+    BinaryOp.SHR: _shr,
+    BinaryOp.ROL: _rol,
+    BinaryOp.ROR: _ror,
+}
+
+
 # ---------------------------------------------------------------------------
 # Private signal exceptions for EXIT/CONTINUE/RETURN
 # ---------------------------------------------------------------------------
@@ -86,6 +147,19 @@ class ExecutionEngine:
         Enum name -> {member: int_value} for literal resolution.
     """
 
+    __slots__ = (
+        "pou",
+        "state",
+        "clock_ms",
+        "pou_registry",
+        "data_type_registry",
+        "enum_registry",
+        "_sfc_tables",
+        "_duration_cache",
+        "_literal_cache",
+        "_fb_engines",
+    )
+
     def __init__(
         self,
         pou: POU,
@@ -101,6 +175,13 @@ class ExecutionEngine:
         self.pou_registry = pou_registry or {}
         self.data_type_registry = data_type_registry or {}
         self.enum_registry = enum_registry or {}
+        # SFC lookup tables, built on the first SFC scan and reused after
+        self._sfc_tables: tuple[dict[str, Step], dict[str, Action]] | None = None
+        self._duration_cache: dict[str, int] = {}
+        # Parsed literal values keyed by (value string, primitive type)
+        self._literal_cache: dict[tuple[str, PrimitiveType | None], object] = {}
+        # Child engines for user FBs, one per FB type, shared by all instances
+        self._fb_engines: dict[str, ExecutionEngine] = {}
 
     # -----------------------------------------------------------------------
     # Public API
@@ -137,8 +218,7 @@ class ExecutionEngine:
         sfc = self.pou.sfc_body
         state = self.state
 
-        # Build step lookup
-        step_map: dict[str, Step] = {s.name: s for s in sfc.steps}
+        step_map, all_actions = self._get_sfc_tables()
 
         # -- 1. Initialize on first scan --
         if not state.get("__sfc_initialized", False):
@@ -253,12 +333,6 @@ class ExecutionEngine:
                         del action_start_time[action.name]
 
         # -- 6. Execute stored actions --
-        # Build a lookup of all actions by name for stored execution
-        all_actions: dict[str, Action] = {}
-        for s in sfc.steps:
-            for a in s.actions + s.entry_actions + s.exit_actions:
-                all_actions[a.name] = a
-
         expired_stored: set[str] = set()
         for action_name in stored_actions:
             if action_name in all_actions:
@@ -329,6 +403,23 @@ class ExecutionEngine:
         state["__sfc_just_activated"] = new_just_activated
         state["__sfc_just_deactivated"] = new_just_deactivated
 
+    def _get_sfc_tables(self) -> tuple[dict[str, Step], dict[str, Action]]:
+        """Return (step_map, all_actions) for the SFC body, built once.
+
+        The SFC structure does not change between scans, so the lookups
+        are cached on the engine rather than rebuilt every cycle.
+        """
+        if self._sfc_tables is None:
+            sfc = self.pou.sfc_body
+            step_map: dict[str, Step] = {s.name: s for s in sfc.steps}
+            # Lookup of all actions by name for stored execution
+            all_actions: dict[str, Action] = {}
+            for s in sfc.steps:
+                for a in s.actions + s.entry_actions + s.exit_actions:
+                    all_actions[a.name] = a
+            self._sfc_tables = (step_map, all_actions)
+        return self._sfc_tables
+
     def _exec_action_body(self, action: Action) -> None:
         """Execute an action's body statements."""
         try:
@@ -336,13 +427,16 @@ class ExecutionEngine:
         except _ReturnSignal:
             pass
 
-    @staticmethod
-    def _parse_action_duration(action: Action) -> int | None:
+    def _parse_action_duration(self, action: Action) -> int | None:
         """Parse action duration to milliseconds, or None if no duration."""
-        if action.duration is None:
+        duration = action.duration
+        if duration is None:
             return None
-        from ._values import _parse_time_literal
-        return _parse_time_literal(action.duration)
+        cache = self._duration_cache
+        if duration not in cache:
+            from ._values import _parse_time_literal
+            cache[duration] = _parse_time_literal(duration)
+        return cache[duration]
 
     # -----------------------------------------------------------------------
     # Statement dispatch
@@ -356,7 +450,13 @@ class ExecutionEngine:
 
     def _exec_assignment(self, stmt: Assignment) -> None:
         value = self._eval(stmt.value)
-        self._write_target(stmt.target, value)
+        target = stmt.target
+        # Plain variable stores dominate — write directly instead of going
+        # through _write_target's kind dispatch.
+        if target.kind == "variable_ref":
+            self.state[target.name] = value
+        else:
+            self._write_target(target, value)
 
     def _exec_if(self, stmt: IfStatement) -> None:
         if self._eval(stmt.if_branch.condition):
@@ -474,15 +574,26 @@ class ExecutionEngine:
                 self._write_target(target_expr, instance_state[param_name])
 
     def _exec_user_fb(self, pou: POU, instance_state: dict) -> None:
-        """Execute a user-defined FB by creating a nested ExecutionEngine."""
-        engine = ExecutionEngine(
-            pou=pou,
-            state=instance_state,
-            clock_ms=self.clock_ms,
-            pou_registry=self.pou_registry,
-            data_type_registry=self.data_type_registry,
-            enum_registry=self.enum_registry,
-        )
+        """Execute a user-defined FB instance on a nested ExecutionEngine.
+
+        One child engine is kept per FB type and re-pointed at each
+        instance's state, so every instance of a type shares the same
+        per-POU caches instead of building a fresh engine per call.
+        """
+        engine = self._fb_engines.get(pou.name)
+        if engine is None or engine.pou is not pou:
+            engine = ExecutionEngine(
+                pou=pou,
+                state=instance_state,
+                clock_ms=self.clock_ms,
+                pou_registry=self.pou_registry,
+                data_type_registry=self.data_type_registry,
+                enum_registry=self.enum_registry,
+            )
+            self._fb_engines[pou.name] = engine
+        else:
+            engine.state = instance_state
+            engine.clock_ms = self.clock_ms
         engine.execute()
 
     def _exec_function_call_stmt(self, stmt: FunctionCallStatement) -> None:
@@ -578,84 +689,47 @@ class ExecutionEngine:
     # -----------------------------------------------------------------------
 
     def _eval(self, expr: Expression) -> object:
-        handler = self._EXPR_DISPATCH.get(expr.kind)
+        kind = expr.kind
+        # Variable reads are the most frequent leaf — resolve them inline
+        if kind == "variable_ref":
+            try:
+                return self.state[expr.name]
+            except KeyError:
+                raise SimulationError(
+                    f"Variable '{expr.name}' not found in state"
+                ) from None
+        handler = self._EXPR_DISPATCH.get(kind)
         if handler is None:
-            raise SimulationError(f"Unsupported expression kind: {expr.kind}")
+            raise SimulationError(f"Unsupported expression kind: {kind}")
         return handler(self, expr)
 
     def _eval_literal(self, expr: LiteralExpr) -> object:
-        return parse_literal(expr.value, expr.data_type, self.enum_registry)
+        # parse_literal only consults primitive type hints, so the value
+        # string plus that primitive type fully determines the result.
+        data_type = expr.data_type
+        ptype = data_type.type if isinstance(data_type, PrimitiveTypeRef) else None
+        key = (expr.value, ptype)
+        cache = self._literal_cache
+        if key not in cache:
+            cache[key] = parse_literal(expr.value, data_type, self.enum_registry)
+        return cache[key]
 
     def _eval_variable_ref(self, expr: VariableRef) -> object:
-        name = expr.name
-        if name in self.state:
-            return self.state[name]
-        raise SimulationError(f"Variable '{name}' not found in state")
+        try:
+            return self.state[expr.name]
+        except KeyError:
+            raise SimulationError(
+                f"Variable '{expr.name}' not found in state"
+            ) from None
 
     def _eval_binary(self, expr: BinaryExpr) -> object:
         # No short-circuit — evaluate both sides (PLC semantics)
         left = self._eval(expr.left)
         right = self._eval(expr.right)
-        return self._apply_binop(expr.op, left, right)
-
-    def _apply_binop(self, op: BinaryOp, left: object, right: object) -> object:
-        if op == BinaryOp.ADD:
-            return left + right
-        if op == BinaryOp.SUB:
-            return left - right
-        if op == BinaryOp.MUL:
-            return left * right
-        if op == BinaryOp.DIV:
-            if isinstance(left, float) or isinstance(right, float):
-                return left / right
-            # IEC integer division: truncate toward zero
-            return int(left / right)
-        if op == BinaryOp.MOD:
-            return left % right
-        if op == BinaryOp.EXPT:
-            return left ** right
-
-        # Logical / bitwise
-        if op == BinaryOp.AND:
-            if isinstance(left, bool) and isinstance(right, bool):
-                return left and right
-            return left & right
-        if op == BinaryOp.OR:
-            if isinstance(left, bool) and isinstance(right, bool):
-                return left or right
-            return left | right
-        if op == BinaryOp.XOR:
-            if isinstance(left, bool) and isinstance(right, bool):
-                return left ^ right
-            return left ^ right
-
-        # Comparison
-        if op == BinaryOp.EQ:
-            return left == right
-        if op == BinaryOp.NE:
-            return left != right
-        if op == BinaryOp.GT:
-            return left > right
-        if op == BinaryOp.GE:
-            return left >= right
-        if op == BinaryOp.LT:
-            return left < right
-        if op == BinaryOp.LE:
-            return left <= right
-
-        # Shift
-        if op == BinaryOp.SHL:
-            return int(left) << int(right)
-        if op == BinaryOp.SHR:
-            return int(left) >> int(right)
-        if op == BinaryOp.ROL:
-            value, n = int(left) & 0xFFFFFFFF, int(right) % 32
-            return ((value << n) | (value >> (32 - n))) & 0xFFFFFFFF
-        if op == BinaryOp.ROR:
-            value, n = int(left) & 0xFFFFFFFF, int(right) % 32
-            return ((value >> n) | (value << (32 - n))) & 0xFFFFFFFF
-
-        raise SimulationError(f"Unsupported binary op: {op}")
+        func = _BINOP_FUNCS.get(expr.op)
+        if func is None:
+            raise SimulationError(f"Unsupported binary op: {expr.op}")
+        return func(left, right)
 
     def _eval_unary(self, expr: UnaryExpr) -> object:
         operand = self._eval(expr.operand)
@@ -744,7 +818,7 @@ class ExecutionEngine:
         bit_index = expr.bit_index
         if bit_index < 0 or bit_index > 63:
             raise SimulationError(f"Bit index {bit_index} out of range (0..63)")
-        return bool((int(value) >> bit_index) & 1)
+        return bool(int(value) & _BIT_MASKS[bit_index])
 
     def _eval_array_access(self, expr: ArrayAccessExpr) -> object:
         array = self._eval(expr.array)
@@ -752,9 +826,10 @@ class ExecutionEngine:
             raise SimulationError(
                 f"Cannot index into {type(array).__name__}"
             )
-        indices = [int(self._eval(idx)) for idx in expr.indices]
+        # Indices are evaluated as they are consumed — no temporary list
         result = array
-        for idx in indices:
+        for idx_expr in expr.indices:
+            idx = int(self._eval(idx_expr))
             if not isinstance(result, list):
                 raise SimulationError("Too many indices for array dimensions")
             if idx < 0 or idx >= len(result):
@@ -808,18 +883,16 @@ class ExecutionEngine:
             bit_index = target.bit_index
             if bit_index < 0 or bit_index > 63:
                 raise SimulationError(f"Bit index {bit_index} out of range (0..63)")
-            if value:
-                new_value = current | (1 << bit_index)
-            else:
-                new_value = current & ~(1 << bit_index)
+            mask = _BIT_MASKS[bit_index]
+            new_value = current | mask if value else current & ~mask
             self._write_target(target.target, new_value)
         elif target.kind == "array_access":
-            array = self._eval(target.array)
-            indices = [int(self._eval(idx)) for idx in target.indices]
-            container = array
-            for idx in indices[:-1]:
-                container = container[idx]
-            container[indices[-1]] = value
+            container = self._eval(target.array)
+            indices = target.indices
+            last = len(indices) - 1
+            for i in range(last):
+                container = container[int(self._eval(indices[i]))]
+            container[int(self._eval(indices[last]))] = value
         else:
             raise SimulationError(
                 f"Unsupported assignment target kind: {target.kind}"
@@ -68,19 +68,31 @@ def _parse_time_literal(value: str) -> int:
 # Literal parsing
 # ---------------------------------------------------------------------------
 
-_INTEGER_TYPES = frozenset({
+# Category membership is tested as a bitmask rather than a frozenset: each
+# PrimitiveType gets a fixed bit, so a category test is a single AND.
+_PTYPE_BIT: dict[PrimitiveType, int] = {
+    ptype: 1 << i for i, ptype in enumerate(PrimitiveType)
+}
+
+
+def _mask(*ptypes: PrimitiveType) -> int:
+    mask = 0
+    for ptype in ptypes:
+        mask |= _PTYPE_BIT[ptype]
+    return mask
+
+
+_INTEGER_MASK = _mask(
     PrimitiveType.SINT, PrimitiveType.INT, PrimitiveType.DINT, PrimitiveType.LINT,
     PrimitiveType.USINT, PrimitiveType.UINT, PrimitiveType.UDINT, PrimitiveType.ULINT,
     PrimitiveType.BYTE, PrimitiveType.WORD, PrimitiveType.DWORD, PrimitiveType.LWORD,
-})
+)
+
+_FLOAT_MASK = _mask(PrimitiveType.REAL, PrimitiveType.LREAL)
 
-_FLOAT_TYPES = frozenset({
-    PrimitiveType.REAL, PrimitiveType.LREAL,
-})
+_TIME_MASK = _mask(PrimitiveType.TIME, PrimitiveType.LTIME)
 
-_TIME_TYPES = frozenset({
-    PrimitiveType.TIME, PrimitiveType.LTIME,
-})
+_CHAR_MASK = _mask(PrimitiveType.CHAR, PrimitiveType.WCHAR)
 
 
 def parse_literal(
@@ -127,14 +139,15 @@ def parse_literal(
         ptype = data_type.type
         if ptype == PrimitiveType.BOOL:
             return upper == "TRUE"
-        if ptype in _TIME_TYPES:
+        bit = _PTYPE_BIT[ptype]
+        if bit & _TIME_MASK:
             return _parse_time_literal(value)
-        if ptype in _FLOAT_TYPES:
+        if bit & _FLOAT_MASK:
             try:
                 return float(value)
             except ValueError:
                 pass
-        if ptype in _INTEGER_TYPES:
+        if bit & _INTEGER_MASK:
             try:
                 return int(value)
             except ValueError:
@@ -166,13 +179,14 @@ def type_default(data_type: TypeRef) -> object:
         ptype = data_type.type
         if ptype == PrimitiveType.BOOL:
             return False
-        if ptype in _INTEGER_TYPES:
+        bit = _PTYPE_BIT[ptype]
+        if bit & _INTEGER_MASK:
             return 0
-        if ptype in _FLOAT_TYPES:
+        if bit & _FLOAT_MASK:
             return 0.0
-        if ptype in _TIME_TYPES:
+        if bit & _TIME_MASK:
             return 0
-        if ptype in (PrimitiveType.CHAR, PrimitiveType.WCHAR):
+        if bit & _CHAR_MASK:
             return ""
         # DATE/TOD/DT/LDT — return 0 for now
         return 0
@@ -203,14 +217,15 @@ def coerce_type(value: object, target_type: TypeRef) -> object:
     if ptype == PrimitiveType.BOOL:
         return bool(value)
 
-    if ptype in _INTEGER_TYPES:
+    bit = _PTYPE_BIT[ptype]
+    if bit & _INTEGER_MASK:
         if isinstance(value, float):
             return int(value)  # truncate toward zero
         if isinstance(value, bool):
             return int(value)
         return value
 
-    if ptype in _FLOAT_TYPES:
+    if bit & _FLOAT_MASK:
         if isinstance(value, (int, bool)):
             return float(value)
         return value
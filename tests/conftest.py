@@ -1,33 +1,108 @@
 """Shared test helpers for the plx test suite."""
 
 import ast
+import functools
 import textwrap
 
-from plx.framework._compiler import ASTCompiler, CompileContext
+import pytest
+
+from plx.framework._compiler import ASTCompiler, CompileContext, CompileError
 from plx.model.pou import Network, POU, POUInterface, POUType
 from plx.model.types import PrimitiveTypeRef
 from plx.model.variables import Variable
 
 
-def compile_stmts(source: str, ctx: CompileContext | None = None) -> list:
-    """Compile Python source (as if inside a logic() body) into IR statements."""
-    if ctx is None:
-        ctx = CompileContext()
+# Parse test snippets with the oldest grammar plx supports (requires-python)
+_FEATURE_VERSION = (3, 11)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_logic_body(source: str) -> ast.FunctionDef:
+    """Parse *source* wrapped in ``def logic(self):``.
+
+    Cached by source string — the compiler only reads the tree, so the
+    same ``FunctionDef`` can be shared across tests.
+    """
     source = textwrap.dedent(source)
     wrapped = f"def logic(self):\n" + textwrap.indent(source, "    ")
-    tree = ast.parse(wrapped)
-    func_def = tree.body[0]
-    compiler = ASTCompiler(ctx)
+    return ast.parse(wrapped, feature_version=_FEATURE_VERSION).body[0]
+
+
+def compile_stmts(
+    source: str,
+    ctx: CompileContext | None = None,
+    *,
+    compiler: ASTCompiler | None = None,
+) -> list:
+    """Compile Python source (as if inside a logic() body) into IR statements.
+
+    Pass *compiler* to reuse an existing ``ASTCompiler`` (and its context)
+    instead of building a fresh one.  Only the parse is cached; every call
+    returns newly built IR.
+    """
+    func_def = parse_logic_body(source)
+    if compiler is None:
+        compiler = ASTCompiler(ctx if ctx is not None else CompileContext())
     return compiler.compile_body(func_def)
 
 
-def compile_expr(source: str, ctx: CompileContext | None = None):
-    """Compile a single Python expression string to an IR expression."""
-    if ctx is None:
-        ctx = CompileContext()
-    tree = ast.parse(source, mode="eval")
-    compiler = ASTCompiler(ctx)
-    return compiler.compile_expression(tree.body)
+@functools.lru_cache(maxsize=4096)
+def parse_expr(source: str) -> ast.expr:
+    """Parse *source* as a single expression, cached by source string."""
+    return ast.parse(source, mode="eval", feature_version=_FEATURE_VERSION).body
+
+
+def compile_expr(
+    source: str,
+    ctx: CompileContext | None = None,
+    *,
+    compiler: ASTCompiler | None = None,
+):
+    """Compile a single Python expression string to an IR expression.
+
+    Like ``compile_stmts``, only the parse is cached.
+    """
+    if compiler is None:
+        compiler = ASTCompiler(ctx if ctx is not None else CompileContext())
+    return compiler.compile_expression(parse_expr(source))
+
+
+def compile_ast(
+    node: ast.FunctionDef | ast.expr,
+    ctx: CompileContext | None = None,
+    *,
+    compiler: ASTCompiler | None = None,
+):
+    """Compile an already-parsed tree from ``parse_logic_body``/``parse_expr``.
+
+    A ``FunctionDef`` compiles to a statement list, anything else to a
+    single IR expression.
+    """
+    if compiler is None:
+        compiler = ASTCompiler(ctx if ctx is not None else CompileContext())
+    if isinstance(node, ast.FunctionDef):
+        return compiler.compile_body(node)
+    return compiler.compile_expression(node)
+
+
+def assert_compile_error(fn, *args, match: str, **kwargs) -> CompileError:
+    """Call *fn* and assert it raises a CompileError containing *match*.
+
+    A plain substring check — cheaper than ``pytest.raises(match=...)``
+    for the large rejection tables, which only check a fixed message.
+    """
+    try:
+        fn(*args, **kwargs)
+    except CompileError as e:
+        assert match in str(e), f"{match!r} not in {str(e)!r}"
+        return e
+    raise AssertionError(f"DID NOT RAISE CompileError (expected {match!r})")
+
+
+@pytest.fixture
+def ctx() -> CompileContext:
+    """A fresh ``CompileContext`` per test."""
+    return CompileContext()
 
 
 def make_pou(stmts=None, **iface_kwargs):
@@ -1,81 +1,103 @@
 """Tests for AST compiler — error handling and rejected nodes."""
 
 import ast
+import re
 import textwrap
 
 import pytest
 
-from conftest import compile_stmts, compile_expr
-
-from plx.framework._compiler import ASTCompiler, CompileContext, CompileError
+from conftest import (
+    assert_compile_error,
+    compile_ast,
+    compile_expr,
+    compile_stmts,
+    parse_expr,
+    parse_logic_body,
+)
+
+from plx.framework._compiler import (
+    _REJECTED_NODES,
+    ASTCompiler,
+    CompileContext,
+    CompileError,
+)
 from plx.framework._descriptors import VarDirection
+from plx.model.types import NamedTypeRef
 
 
-# ---------------------------------------------------------------------------
-# Rejected statement nodes
-# ---------------------------------------------------------------------------
+# Error-message patterns, compiled once at import
+_RE_RANGE_FOR_LOOP = re.compile(r"range.*for loop")
+_RE_RANGE = re.compile("range")
+_RE_SIMPLE_NAME = re.compile("simple name")
+_RE_ONE_ARGUMENT = re.compile("exactly 1 argument")
+_RE_SENTINEL_STATEMENT = re.compile("must be used in an expression")
+_RE_REQUIRES_SIGNAL = re.compile("requires a signal")
+_RE_REQUIRES_SECONDS = re.compile("requires seconds")
+_RE_SOURCE_FILE = re.compile(r"test\.py")
+_RE_KEYWORD_ARGS = re.compile("keyword arguments")
+_RE_UNSUPPORTED_BINOP = re.compile("Unsupported binary operator")
 
-class TestRejectedStatements:
-    def test_function_def(self):
-        with pytest.raises(CompileError, match="Function definitions"):
-            compile_stmts("def foo(): pass")
+_TON = NamedTypeRef(name="TON")
 
-    def test_class_def(self):
-        with pytest.raises(CompileError, match="Class definitions"):
-            compile_stmts("class Foo: pass")
 
-    def test_delete(self):
-        with pytest.raises(CompileError, match="del statements"):
-            compile_stmts("del x")
+# nonlocal requires an enclosing scope, so the logic() under test is the
+# inner function of a wrapper.  The tree never changes — parse it once.
+_NONLOCAL_LOGIC = ast.parse(textwrap.dedent("""\
+    def outer():
+        x = 1
+        def logic(self):
+            nonlocal x
+""")).body[0].body[1]
 
-    def test_with(self):
-        with pytest.raises(CompileError, match="with statements"):
-            compile_stmts("with open('f') as f: pass")
 
-    def test_raise(self):
-        with pytest.raises(CompileError, match="raise statements"):
-            compile_stmts("raise ValueError()")
+# Shared contexts for tests that only need the compiler to reject the
+# snippet — compilation stops at the error, so the contexts are never
+# mutated and can live for the whole module.
 
-    def test_try(self):
-        with pytest.raises(CompileError, match="try/except"):
-            compile_stmts("""\
-try:
-    pass
-except:
-    pass
-""")
+@pytest.fixture(scope="module")
+def timer_ctx():
+    return CompileContext(
+        declared_vars={"timer": VarDirection.STATIC},
+        static_var_types={"timer": _TON},
+    )
+
+
+@pytest.fixture(scope="module")
+def static_ab_ctx():
+    return CompileContext(
+        declared_vars={"a": VarDirection.STATIC, "b": VarDirection.STATIC},
+    )
 
-    def test_assert(self):
-        with pytest.raises(CompileError, match="assert statements"):
-            compile_stmts("assert True")
 
-    def test_import(self):
-        with pytest.raises(CompileError, match="import statements"):
-            compile_stmts("import os")
+@pytest.fixture(scope="class")
+def rejecting_compiler():
+    """One ASTCompiler per class for snippets rejected at their top node."""
+    return ASTCompiler(CompileContext())
 
-    def test_import_from(self):
-        with pytest.raises(CompileError, match="import statements"):
-            compile_stmts("from os import path")
 
-    def test_global(self):
-        with pytest.raises(CompileError, match="global statements"):
-            compile_stmts("global x")
+# ---------------------------------------------------------------------------
+# Rejected statement nodes
+# ---------------------------------------------------------------------------
 
-    def test_nonlocal(self):
-        # nonlocal requires an enclosing scope, so wrap it
+class TestRejectedStatements:
+    @pytest.mark.parametrize("tree, match", [
+        pytest.param(parse_logic_body("def foo(): pass"), "Function definitions", id="function_def"),
+        pytest.param(parse_logic_body("class Foo: pass"), "Class definitions", id="class_def"),
+        pytest.param(parse_logic_body("del x"), "del statements", id="delete"),
+        pytest.param(parse_logic_body("with open('f') as f: pass"), "with statements", id="with"),
+        pytest.param(parse_logic_body("raise ValueError()"), "raise statements", id="raise"),
+        pytest.param(parse_logic_body("try:\n    pass\nexcept:\n    pass\n"), "try/except", id="try"),
+        pytest.param(parse_logic_body("assert True"), "assert statements", id="assert"),
+        pytest.param(parse_logic_body("import os"), "import statements", id="import"),
+        pytest.param(parse_logic_body("from os import path"), "import statements", id="import_from"),
+        pytest.param(parse_logic_body("global x"), "global statements", id="global"),
+    ])
+    def test_rejected(self, rejecting_compiler, tree, match):
+        assert_compile_error(compile_ast, tree, compiler=rejecting_compiler, match=match)
+
+    def test_nonlocal(self, rejecting_compiler):
         with pytest.raises(CompileError):
-            source = textwrap.dedent("""\
-def outer():
-    x = 1
-    def logic(self):
-        nonlocal x
-""")
-            tree = ast.parse(source)
-            # Extract the inner function
-            inner = tree.body[0].body[1]
-            ctx = CompileContext()
-            compiler = ASTCompiler(ctx)
-            compiler.compile_body(inner)
+            rejecting_compiler.compile_body(_NONLOCAL_LOGIC)
 
 
 # ---------------------------------------------------------------------------
@@ -83,49 +105,27 @@ def outer():
 # ---------------------------------------------------------------------------
 
 class TestRejectedExpressions:
-    def test_lambda(self):
-        with pytest.raises(CompileError, match="Lambda"):
-            compile_expr("lambda x: x")
-
-    def test_dict(self):
-        with pytest.raises(CompileError, match="Dict"):
-            compile_expr("{'a': 1}")
-
-    def test_set(self):
-        with pytest.raises(CompileError, match="Set"):
-            compile_expr("{1, 2, 3}")
-
-    def test_list(self):
-        with pytest.raises(CompileError, match="List"):
-            compile_expr("[1, 2, 3]")
-
-    def test_tuple(self):
-        with pytest.raises(CompileError, match="Tuple"):
-            compile_expr("(1, 2)")
-
-    def test_list_comp(self):
-        with pytest.raises(CompileError, match="List comprehension"):
-            compile_expr("[x for x in range(10)]")
-
-    def test_dict_comp(self):
-        with pytest.raises(CompileError, match="Dict comprehension"):
-            compile_expr("{k: v for k, v in items}")
-
-    def test_set_comp(self):
-        with pytest.raises(CompileError, match="Set comprehension"):
-            compile_expr("{x for x in items}")
-
-    def test_generator_exp(self):
-        with pytest.raises(CompileError, match="Generator"):
-            compile_expr("sum(x for x in items)")
-
-    def test_fstring(self):
-        with pytest.raises(CompileError, match="f-string"):
-            compile_expr("f'hello {x}'")
-
-    def test_walrus(self):
-        with pytest.raises(CompileError, match="Walrus"):
-            compile_expr("(x := 5)")
+    @pytest.mark.parametrize("tree, match", [
+        pytest.param(parse_expr("lambda x: x"), "Lambda", id="lambda"),
+        pytest.param(parse_expr("{'a': 1}"), "Dict", id="dict"),
+        pytest.param(parse_expr("{1, 2, 3}"), "Set", id="set"),
+        pytest.param(parse_expr("[1, 2, 3]"), "List", id="list"),
+        pytest.param(parse_expr("(1, 2)"), "Tuple", id="tuple"),
+        pytest.param(parse_expr("[x for x in range(10)]"), "List comprehension", id="list_comp"),
+        pytest.param(parse_expr("{k: v for k, v in items}"), "Dict comprehension", id="dict_comp"),
+        pytest.param(parse_expr("{x for x in items}"), "Set comprehension", id="set_comp"),
+        pytest.param(parse_expr("sum(x for x in items)"), "Generator", id="generator_exp"),
+        pytest.param(parse_expr("f'hello {x}'"), "f-string", id="fstring"),
+        pytest.param(parse_expr("(x := 5)"), "Walrus", id="walrus"),
+    ])
+    def test_rejected(self, rejecting_compiler, tree, match):
+        assert_compile_error(compile_ast, tree, compiler=rejecting_compiler, match=match)
+
+
+def test_rejected_nodes_have_no_handler():
+    # Dispatch only consults _REJECTED_NODES when no handler matches.
+    handled = set(ASTCompiler._STATEMENT_HANDLERS) | set(ASTCompiler._EXPRESSION_HANDLERS)
+    assert not handled & set(_REJECTED_NODES)
 
 
 # ---------------------------------------------------------------------------
@@ -134,59 +134,51 @@ class TestRejectedExpressions:
 
 class TestSpecificErrors:
     def test_range_outside_for(self):
-        with pytest.raises(CompileError, match="range.*for loop"):
+        with pytest.raises(CompileError, match=_RE_RANGE_FOR_LOOP):
             compile_expr("range(10)")
 
     def test_for_non_range(self):
-        with pytest.raises(CompileError, match="range"):
+        with pytest.raises(CompileError, match=_RE_RANGE):
             compile_stmts("""\
 for x in items:
     self.y = x
 """)
 
     def test_for_non_name_target(self):
-        with pytest.raises(CompileError, match="simple name"):
+        with pytest.raises(CompileError, match=_RE_SIMPLE_NAME):
             compile_stmts("""\
 for a, b in range(10):
     pass
 """)
 
     def test_type_conv_wrong_arg_count(self):
-        with pytest.raises(CompileError, match="exactly 1 argument"):
+        with pytest.raises(CompileError, match=_RE_ONE_ARGUMENT):
             compile_expr("INT_TO_REAL(a, b)")
 
     def test_sentinel_as_statement(self):
-        with pytest.raises(CompileError, match="must be used in an expression"):
+        with pytest.raises(CompileError, match=_RE_SENTINEL_STATEMENT):
             compile_stmts("delayed(self.input, seconds=5)")
 
     def test_sentinel_no_signal(self):
-        with pytest.raises(CompileError, match="requires a signal"):
+        with pytest.raises(CompileError, match=_RE_REQUIRES_SIGNAL):
             compile_expr("delayed()")
 
-    def test_sentinel_no_duration(self):
-        with pytest.raises(CompileError, match="requires seconds"):
-            ctx = CompileContext()
-            stmts = compile_stmts("self.x = delayed(self.input)", ctx)
+    def test_sentinel_no_duration(self, ctx):
+        with pytest.raises(CompileError, match=_RE_REQUIRES_SECONDS):
+            compile_stmts("self.x = delayed(self.input)", ctx)
 
     def test_rising_no_signal(self):
-        with pytest.raises(CompileError, match="requires a signal"):
+        with pytest.raises(CompileError, match=_RE_REQUIRES_SIGNAL):
             compile_expr("rising()")
 
     def test_compile_error_has_location(self):
         ctx = CompileContext(source_file="test.py", source_line_offset=10)
-        with pytest.raises(CompileError, match="test.py"):
+        with pytest.raises(CompileError, match=_RE_SOURCE_FILE):
             compile_stmts("def foo(): pass", ctx)
 
-    def test_fb_positional_args_rejected(self):
-        ctx = CompileContext(
-            declared_vars={"timer": VarDirection.STATIC},
-            static_var_types={"timer": NamedTypeRef(name="TON")},
-        )
-        with pytest.raises(CompileError, match="keyword arguments"):
-            compile_stmts("self.timer(self.input, self.preset)", ctx)
-
-
-from plx.model.types import NamedTypeRef
+    def test_fb_positional_args_rejected(self, timer_ctx):
+        with pytest.raises(CompileError, match=_RE_KEYWORD_ARGS):
+            compile_stmts("self.timer(self.input, self.preset)", timer_ctx)
 
 
 # ---------------------------------------------------------------------------
@@ -194,8 +186,7 @@ from plx.model.types import NamedTypeRef
 # ---------------------------------------------------------------------------
 
 class TestMatMultRejected:
-    def test_matmult_raises(self):
+    def test_matmult_raises(self, static_ab_ctx):
         """@ operator (MatMult) must be rejected in logic()."""
-        ctx = CompileContext(declared_vars={"a": VarDirection.STATIC, "b": VarDirection.STATIC})
-        with pytest.raises(CompileError, match="Unsupported binary operator"):
-            compile_stmts("self.a = self.a @ self.b", ctx)
+        with pytest.raises(CompileError, match=_RE_UNSUPPORTED_BINOP):
+            compile_stmts("self.a = self.a @ self.b", static_ab_ctx)
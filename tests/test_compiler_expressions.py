@@ -1,5 +1,7 @@
 """Tests for AST compiler — expression handlers."""
 
+import re
+
 import pytest
 
 from conftest import compile_expr, compile_stmts
@@ -22,397 +24,390 @@ from plx.model.expressions import (
 from plx.model.types import PrimitiveType, PrimitiveTypeRef, NamedTypeRef
 
 
+# Error-message patterns, compiled once at import
+_RE_BITWISE_INVERT = re.compile("Bitwise ~")
+
+# Expected type refs, built once and compared by value
+_BOOL = PrimitiveTypeRef(type=PrimitiveType.BOOL)
+_REAL = PrimitiveTypeRef(type=PrimitiveType.REAL)
+_DINT = PrimitiveTypeRef(type=PrimitiveType.DINT)
+_MY_TYPE = NamedTypeRef(name="MyType")
+
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-class TestConstant:
-    def test_int(self):
-        result = compile_expr("42")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "42"
-
-    def test_float(self):
-        result = compile_expr("3.14")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "3.14"
-
-    def test_bool_true(self):
-        result = compile_expr("True")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "TRUE"
-        assert result.data_type == PrimitiveTypeRef(type=PrimitiveType.BOOL)
-
-    def test_bool_false(self):
-        result = compile_expr("False")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "FALSE"
-
-    def test_string(self):
-        result = compile_expr("'hello'")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "'hello'"
-
-    def test_negative_int(self):
-        result = compile_expr("-5")
-        assert isinstance(result, UnaryExpr)
-        assert result.op == UnaryOp.NEG
-        assert isinstance(result.operand, LiteralExpr)
-        assert result.operand.value == "5"
-
-    def test_zero(self):
-        result = compile_expr("0")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "0"
-
-    def test_large_int(self):
-        result = compile_expr("1000000")
-        assert isinstance(result, LiteralExpr)
-        assert result.value == "1000000"
+def test_constant_int():
+    result = compile_expr("42")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "42"
 
 
-# ---------------------------------------------------------------------------
-# Variable references
-# ---------------------------------------------------------------------------
+def test_constant_float():
+    result = compile_expr("3.14")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "3.14"
 
-class TestVariableRef:
-    def test_simple_name(self):
-        result = compile_expr("x")
-        assert isinstance(result, VariableRef)
-        assert result.name == "x"
 
-    def test_self_attr(self):
-        result = compile_expr("self.sensor")
-        assert isinstance(result, VariableRef)
-        assert result.name == "sensor"
+def test_constant_bool_true():
+    result = compile_expr("True")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "TRUE"
+    assert result.data_type == _BOOL
 
-    def test_member_access(self):
-        result = compile_expr("self.fb.Q")
-        assert isinstance(result, MemberAccessExpr)
-        assert result.member == "Q"
-        assert isinstance(result.struct, VariableRef)
-        assert result.struct.name == "fb"
 
-    def test_nested_member_access(self):
-        result = compile_expr("self.a.b.c")
-        assert isinstance(result, MemberAccessExpr)
-        assert result.member == "c"
-        assert isinstance(result.struct, MemberAccessExpr)
-        assert result.struct.member == "b"
+def test_constant_bool_false():
+    result = compile_expr("False")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "FALSE"
 
 
-# ---------------------------------------------------------------------------
-# Binary operators
-# ---------------------------------------------------------------------------
+def test_constant_string():
+    result = compile_expr("'hello'")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "'hello'"
 
-class TestBinaryOp:
-    def test_add(self):
-        result = compile_expr("a + b")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.ADD
 
-    def test_sub(self):
-        result = compile_expr("a - b")
-        assert result.op == BinaryOp.SUB
+def test_constant_negative_int():
+    result = compile_expr("-5")
+    assert isinstance(result, UnaryExpr)
+    assert result.op == UnaryOp.NEG
+    assert isinstance(result.operand, LiteralExpr)
+    assert result.operand.value == "5"
 
-    def test_mul(self):
-        result = compile_expr("a * b")
-        assert result.op == BinaryOp.MUL
 
-    def test_div(self):
-        result = compile_expr("a / b")
-        assert result.op == BinaryOp.DIV
+def test_constant_zero():
+    result = compile_expr("0")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "0"
 
-    def test_mod(self):
-        result = compile_expr("a % b")
-        assert result.op == BinaryOp.MOD
 
-    def test_bitand(self):
-        with pytest.raises(CompileError, match="Bitwise &"):
-            compile_expr("a & b")
+def test_constant_large_int():
+    result = compile_expr("1000000")
+    assert isinstance(result, LiteralExpr)
+    assert result.value == "1000000"
 
-    def test_bitor(self):
-        with pytest.raises(CompileError, match="Bitwise \\|"):
-            compile_expr("a | b")
 
-    def test_bitxor(self):
-        result = compile_expr("a ^ b")
-        assert result.op == BinaryOp.XOR
+# ---------------------------------------------------------------------------
+# Variable references
+# ---------------------------------------------------------------------------
 
-    def test_lshift(self):
-        result = compile_expr("a << b")
-        assert result.op == BinaryOp.SHL
+def test_variable_ref_simple_name():
+    result = compile_expr("x")
+    assert isinstance(result, VariableRef)
+    assert result.name == "x"
 
-    def test_rshift(self):
-        result = compile_expr("a >> b")
-        assert result.op == BinaryOp.SHR
 
-    def test_pow(self):
-        result = compile_expr("a ** b")
-        assert result.op == BinaryOp.EXPT
+def test_variable_ref_self_attr():
+    result = compile_expr("self.sensor")
+    assert isinstance(result, VariableRef)
+    assert result.name == "sensor"
 
-    def test_floordiv(self):
-        with pytest.raises(CompileError, match="Floor division"):
-            compile_expr("a // b")
 
-    def test_nested(self):
-        result = compile_expr("a + b * c")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.ADD
-        assert isinstance(result.right, BinaryExpr)
-        assert result.right.op == BinaryOp.MUL
+def test_variable_ref_member_access():
+    result = compile_expr("self.fb.Q")
+    assert isinstance(result, MemberAccessExpr)
+    assert result.member == "Q"
+    assert isinstance(result.struct, VariableRef)
+    assert result.struct.name == "fb"
 
-    def test_floordiv_augassign(self):
-        with pytest.raises(CompileError, match="Floor division"):
-            compile_stmts("a //= b")
 
-    def test_bitand_augassign(self):
-        with pytest.raises(CompileError, match="Bitwise &"):
-            compile_stmts("a &= b")
+def test_variable_ref_nested_member_access():
+    result = compile_expr("self.a.b.c")
+    assert isinstance(result, MemberAccessExpr)
+    assert result.member == "c"
+    assert isinstance(result.struct, MemberAccessExpr)
+    assert result.struct.member == "b"
 
-    def test_bitor_augassign(self):
-        with pytest.raises(CompileError, match="Bitwise \\|"):
-            compile_stmts("a |= b")
+
+# ---------------------------------------------------------------------------
+# Binary operators
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("source, op", [
+    pytest.param("a + b", BinaryOp.ADD, id="add"),
+    pytest.param("a - b", BinaryOp.SUB, id="sub"),
+    pytest.param("a * b", BinaryOp.MUL, id="mul"),
+    pytest.param("a / b", BinaryOp.DIV, id="div"),
+    pytest.param("a % b", BinaryOp.MOD, id="mod"),
+    pytest.param("a ^ b", BinaryOp.XOR, id="bitxor"),
+    pytest.param("a << b", BinaryOp.SHL, id="lshift"),
+    pytest.param("a >> b", BinaryOp.SHR, id="rshift"),
+    pytest.param("a ** b", BinaryOp.EXPT, id="pow"),
+])
+def test_binary_op(source, op):
+    result = compile_expr(source)
+    assert isinstance(result, BinaryExpr)
+    assert result.op == op
+
+
+@pytest.mark.parametrize("source, match", [
+    pytest.param("a & b", re.compile("Bitwise &"), id="bitand"),
+    pytest.param("a | b", re.compile(r"Bitwise \|"), id="bitor"),
+    pytest.param("a // b", re.compile("Floor division"), id="floordiv"),
+])
+def test_binary_op_rejected(source, match):
+    with pytest.raises(CompileError, match=match):
+        compile_expr(source)
+
+
+@pytest.mark.parametrize("source, match", [
+    pytest.param("a //= b", re.compile("Floor division"), id="floordiv"),
+    pytest.param("a &= b", re.compile("Bitwise &"), id="bitand"),
+    pytest.param("a |= b", re.compile(r"Bitwise \|"), id="bitor"),
+])
+def test_binary_op_rejected_augassign(source, match):
+    with pytest.raises(CompileError, match=match):
+        compile_stmts(source)
+
+
+def test_binary_op_nested():
+    result = compile_expr("a + b * c")
+    assert isinstance(result, BinaryExpr)
+    assert result.op == BinaryOp.ADD
+    assert isinstance(result.right, BinaryExpr)
+    assert result.right.op == BinaryOp.MUL
 
 
 # ---------------------------------------------------------------------------
 # Boolean operators
 # ---------------------------------------------------------------------------
 
-class TestBoolOp:
-    def test_and(self):
-        result = compile_expr("a and b")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.AND
+@pytest.mark.parametrize("source, op", [
+    pytest.param("a and b", BinaryOp.AND, id="and"),
+    pytest.param("a or b", BinaryOp.OR, id="or"),
+])
+def test_bool_op(source, op):
+    result = compile_expr(source)
+    assert isinstance(result, BinaryExpr)
+    assert result.op == op
+
 
-    def test_or(self):
-        result = compile_expr("a or b")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.OR
+def test_bool_op_chain_and():
+    result = compile_expr("a and b and c")
+    assert isinstance(result, BinaryExpr)
+    assert result.op == BinaryOp.AND
+    assert isinstance(result.left, BinaryExpr)
+    assert result.left.op == BinaryOp.AND
 
-    def test_chain_and(self):
-        result = compile_expr("a and b and c")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.AND
-        assert isinstance(result.left, BinaryExpr)
-        assert result.left.op == BinaryOp.AND
 
-    def test_chain_or(self):
-        result = compile_expr("a or b or c")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.OR
-        assert isinstance(result.left, BinaryExpr)
+def test_bool_op_chain_or():
+    result = compile_expr("a or b or c")
+    assert isinstance(result, BinaryExpr)
+    assert result.op == BinaryOp.OR
+    assert isinstance(result.left, BinaryExpr)
 
 
 # ---------------------------------------------------------------------------
 # Comparisons
 # ---------------------------------------------------------------------------
 
-class TestCompare:
-    def test_eq(self):
-        result = compile_expr("a == b")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.EQ
+@pytest.mark.parametrize("source, op", [
+    pytest.param("a == b", BinaryOp.EQ, id="eq"),
+    pytest.param("a != b", BinaryOp.NE, id="ne"),
+    pytest.param("a > b", BinaryOp.GT, id="gt"),
+    pytest.param("a >= b", BinaryOp.GE, id="ge"),
+    pytest.param("a < b", BinaryOp.LT, id="lt"),
+    pytest.param("a <= b", BinaryOp.LE, id="le"),
+])
+def test_compare(source, op):
+    result = compile_expr(source)
+    assert isinstance(result, BinaryExpr)
+    assert result.op == op
+
+
+def test_compare_chained():
+    result = compile_expr("a < b < c")
+    assert isinstance(result, BinaryExpr)
+    assert result.op == BinaryOp.AND
+    assert isinstance(result.left, BinaryExpr)
+    assert result.left.op == BinaryOp.LT
+    assert isinstance(result.right, BinaryExpr)
+    assert result.right.op == BinaryOp.LT
+
+
+# ---------------------------------------------------------------------------
+# Unary operators
+# ---------------------------------------------------------------------------
+
+def test_unary_op_not():
+    result = compile_expr("not a")
+    assert isinstance(result, UnaryExpr)
+    assert result.op == UnaryOp.NOT
 
-    def test_ne(self):
-        result = compile_expr("a != b")
-        assert result.op == BinaryOp.NE
 
-    def test_gt(self):
-        result = compile_expr("a > b")
-        assert result.op == BinaryOp.GT
+def test_unary_op_neg():
+    result = compile_expr("-a")
+    assert isinstance(result, UnaryExpr)
+    assert result.op == UnaryOp.NEG
 
-    def test_ge(self):
-        result = compile_expr("a >= b")
-        assert result.op == BinaryOp.GE
 
-    def test_lt(self):
-        result = compile_expr("a < b")
-        assert result.op == BinaryOp.LT
+def test_unary_op_invert():
+    with pytest.raises(CompileError, match=_RE_BITWISE_INVERT):
+        compile_expr("~a")
 
-    def test_le(self):
-        result = compile_expr("a <= b")
-        assert result.op == BinaryOp.LE
 
-    def test_chained(self):
-        result = compile_expr("a < b < c")
-        assert isinstance(result, BinaryExpr)
-        assert result.op == BinaryOp.AND
-        assert isinstance(result.left, BinaryExpr)
-        assert result.left.op == BinaryOp.LT
-        assert isinstance(result.right, BinaryExpr)
-        assert result.right.op == BinaryOp.LT
+def test_unary_op_uadd():
+    result = compile_expr("+a")
+    assert isinstance(result, VariableRef)
+    assert result.name == "a"
 
 
 # ---------------------------------------------------------------------------
-# Unary operators
+# Function calls
 # ---------------------------------------------------------------------------
 
-class TestUnaryOp:
-    def test_not(self):
-        result = compile_expr("not a")
-        assert isinstance(result, UnaryExpr)
-        assert result.op == UnaryOp.NOT
+def test_function_call_simple_call():
+    result = compile_expr("SQRT(x)")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "SQRT"
+    assert len(result.args) == 1
 
-    def test_neg(self):
-        result = compile_expr("-a")
-        assert isinstance(result, UnaryExpr)
-        assert result.op == UnaryOp.NEG
 
-    def test_invert(self):
-        with pytest.raises(CompileError, match="Bitwise ~"):
-            compile_expr("~a")
+def test_function_call_call_with_kwargs():
+    result = compile_expr("LIMIT(MN=0, IN=x, MX=100)")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "LIMIT"
+    assert len(result.args) == 3
+    assert result.args[0].name == "MN"
 
-    def test_uadd(self):
-        result = compile_expr("+a")
-        assert isinstance(result, VariableRef)
-        assert result.name == "a"
 
+def test_function_call_abs_builtin():
+    result = compile_expr("abs(x)")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "ABS"
+
+
+def test_function_call_min_builtin():
+    result = compile_expr("min(a, b)")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "MIN"
 
-# ---------------------------------------------------------------------------
-# Function calls
-# ---------------------------------------------------------------------------
 
-class TestFunctionCall:
-    def test_simple_call(self):
-        result = compile_expr("SQRT(x)")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "SQRT"
-        assert len(result.args) == 1
-
-    def test_call_with_kwargs(self):
-        result = compile_expr("LIMIT(MN=0, IN=x, MX=100)")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "LIMIT"
-        assert len(result.args) == 3
-        assert result.args[0].name == "MN"
-
-    def test_abs_builtin(self):
-        result = compile_expr("abs(x)")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "ABS"
-
-    def test_min_builtin(self):
-        result = compile_expr("min(a, b)")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "MIN"
-
-    def test_max_builtin(self):
-        result = compile_expr("max(a, b)")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "MAX"
-
-    def test_generic_function(self):
-        result = compile_expr("MyFunc(a, b)")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "MyFunc"
+def test_function_call_max_builtin():
+    result = compile_expr("max(a, b)")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "MAX"
+
+
+def test_function_call_generic_function():
+    result = compile_expr("MyFunc(a, b)")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "MyFunc"
 
 
 # ---------------------------------------------------------------------------
 # Type conversion
 # ---------------------------------------------------------------------------
 
-class TestTypeConversion:
-    def test_int_to_real(self):
-        result = compile_expr("INT_TO_REAL(x)")
-        assert isinstance(result, TypeConversionExpr)
-        assert result.target_type == PrimitiveTypeRef(type=PrimitiveType.REAL)
-        assert isinstance(result.source, VariableRef)
+def test_type_conversion_int_to_real():
+    result = compile_expr("INT_TO_REAL(x)")
+    assert isinstance(result, TypeConversionExpr)
+    assert result.target_type == _REAL
+    assert isinstance(result.source, VariableRef)
+
 
-    def test_real_to_dint(self):
-        result = compile_expr("REAL_TO_DINT(x)")
-        assert isinstance(result, TypeConversionExpr)
-        assert result.target_type == PrimitiveTypeRef(type=PrimitiveType.DINT)
+def test_type_conversion_real_to_dint():
+    result = compile_expr("REAL_TO_DINT(x)")
+    assert isinstance(result, TypeConversionExpr)
+    assert result.target_type == _DINT
 
-    def test_unknown_target_type(self):
-        result = compile_expr("INT_TO_MyType(x)")
-        assert isinstance(result, TypeConversionExpr)
-        assert result.target_type == NamedTypeRef(name="MyType")
+
+def test_type_conversion_unknown_target_type():
+    result = compile_expr("INT_TO_MyType(x)")
+    assert isinstance(result, TypeConversionExpr)
+    assert result.target_type == _MY_TYPE
 
 
 # ---------------------------------------------------------------------------
 # Array access
 # ---------------------------------------------------------------------------
 
-class TestArrayAccess:
-    def test_single_dim(self):
-        result = compile_expr("a[0]")
-        assert isinstance(result, ArrayAccessExpr)
-        assert len(result.indices) == 1
-        assert isinstance(result.indices[0], LiteralExpr)
-        assert result.indices[0].value == "0"
+def test_array_access_single_dim():
+    result = compile_expr("a[0]")
+    assert isinstance(result, ArrayAccessExpr)
+    assert len(result.indices) == 1
+    assert isinstance(result.indices[0], LiteralExpr)
+    assert result.indices[0].value == "0"
+
+
+def test_array_access_multi_dim():
+    result = compile_expr("a[i, j]")
+    assert isinstance(result, ArrayAccessExpr)
+    assert len(result.indices) == 2
 
-    def test_multi_dim(self):
-        result = compile_expr("a[i, j]")
-        assert isinstance(result, ArrayAccessExpr)
-        assert len(result.indices) == 2
 
-    def test_expression_index(self):
-        result = compile_expr("a[i + 1]")
-        assert isinstance(result, ArrayAccessExpr)
-        assert isinstance(result.indices[0], BinaryExpr)
+def test_array_access_expression_index():
+    result = compile_expr("a[i + 1]")
+    assert isinstance(result, ArrayAccessExpr)
+    assert isinstance(result.indices[0], BinaryExpr)
 
 
 # ---------------------------------------------------------------------------
 # Ternary (if expression)
 # ---------------------------------------------------------------------------
 
-class TestIfExp:
-    def test_basic(self):
-        result = compile_expr("a if cond else b")
-        assert isinstance(result, FunctionCallExpr)
-        assert result.function_name == "SEL"
-        assert len(result.args) == 3
-        # SEL(cond, false_val, true_val)
-        assert isinstance(result.args[0].value, VariableRef)
-        assert result.args[0].value.name == "cond"
-        assert isinstance(result.args[1].value, VariableRef)
-        assert result.args[1].value.name == "b"  # false value
-        assert isinstance(result.args[2].value, VariableRef)
-        assert result.args[2].value.name == "a"  # true value
+def test_if_exp_basic():
+    result = compile_expr("a if cond else b")
+    assert isinstance(result, FunctionCallExpr)
+    assert result.function_name == "SEL"
+    assert len(result.args) == 3
+    # SEL(cond, false_val, true_val)
+    assert isinstance(result.args[0].value, VariableRef)
+    assert result.args[0].value.name == "cond"
+    assert isinstance(result.args[1].value, VariableRef)
+    assert result.args[1].value.name == "b"  # false value
+    assert isinstance(result.args[2].value, VariableRef)
+    assert result.args[2].value.name == "a"  # true value
 
 
 # ---------------------------------------------------------------------------
 # Bit access
 # ---------------------------------------------------------------------------
 
-class TestBitAccess:
-    def test_self_attr_bit5(self):
-        result = compile_expr("self.status.bit5")
-        assert isinstance(result, BitAccessExpr)
-        assert isinstance(result.target, VariableRef)
-        assert result.target.name == "status"
-        assert result.bit_index == 5
-
-    def test_bit0(self):
-        result = compile_expr("self.word.bit0")
-        assert isinstance(result, BitAccessExpr)
-        assert result.bit_index == 0
-
-    def test_bit31(self):
-        result = compile_expr("self.dword.bit31")
-        assert isinstance(result, BitAccessExpr)
-        assert result.bit_index == 31
-
-    def test_nested_member_bit_access(self):
-        result = compile_expr("self.data.status.bit3")
-        assert isinstance(result, BitAccessExpr)
-        assert result.bit_index == 3
-        assert isinstance(result.target, MemberAccessExpr)
-        assert result.target.member == "status"
-
-    def test_array_element_bit_access(self):
-        result = compile_expr("self.arr[0].bit7")
-        assert isinstance(result, BitAccessExpr)
-        assert result.bit_index == 7
-        assert isinstance(result.target, ArrayAccessExpr)
-
-    def test_regular_member_no_false_positive(self):
-        result = compile_expr("self.data.status")
-        assert isinstance(result, MemberAccessExpr)
-        assert result.member == "status"
-
-    def test_partial_match_no_false_positive(self):
-        result = compile_expr("self.data.bitmap")
-        assert isinstance(result, MemberAccessExpr)
-        assert result.member == "bitmap"
+def test_bit_access_self_attr_bit5():
+    result = compile_expr("self.status.bit5")
+    assert isinstance(result, BitAccessExpr)
+    assert isinstance(result.target, VariableRef)
+    assert result.target.name == "status"
+    assert result.bit_index == 5
+
+
+def test_bit_access_bit0():
+    result = compile_expr("self.word.bit0")
+    assert isinstance(result, BitAccessExpr)
+    assert result.bit_index == 0
+
+
+def test_bit_access_bit31():
+    result = compile_expr("self.dword.bit31")
+    assert isinstance(result, BitAccessExpr)
+    assert result.bit_index == 31
+
+
+def test_bit_access_nested_member():
+    result = compile_expr("self.data.status.bit3")
+    assert isinstance(result, BitAccessExpr)
+    assert result.bit_index == 3
+    assert isinstance(result.target, MemberAccessExpr)
+    assert result.target.member == "status"
+
+
+def test_bit_access_array_element():
+    result = compile_expr("self.arr[0].bit7")
+    assert isinstance(result, BitAccessExpr)
+    assert result.bit_index == 7
+    assert isinstance(result.target, ArrayAccessExpr)
+
+
+def test_bit_access_regular_member_no_false_positive():
+    result = compile_expr("self.data.status")
+    assert isinstance(result, MemberAccessExpr)
+    assert result.member == "status"
+
+
+def test_bit_access_partial_match_no_false_positive():
+    result = compile_expr("self.data.bitmap")
+    assert isinstance(result, MemberAccessExpr)
+    assert result.member == "bitmap"
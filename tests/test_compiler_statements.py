@@ -1,8 +1,9 @@
 """Tests for AST compiler — statement handlers."""
 
+import pytest
+
 from conftest import compile_stmts
 
-from plx.framework._compiler import CompileContext
 from plx.framework._descriptors import VarDirection
 from plx.model.expressions import (
     BinaryExpr,
@@ -13,12 +14,10 @@ from plx.model.expressions import (
 )
 from plx.model.statements import (
     Assignment,
-    CaseBranch,
     CaseStatement,
     ContinueStatement,
     ExitStatement,
     ForStatement,
-    IfBranch,
     IfStatement,
     ReturnStatement,
     WhileStatement,
@@ -45,14 +44,13 @@ class TestAssignment:
         assert len(stmts) == 1
         assert isinstance(stmts[0].value, BinaryExpr)
 
-    def test_bare_name_declared(self):
-        ctx = CompileContext(declared_vars={"x": VarDirection.TEMP})
+    def test_bare_name_declared(self, ctx):
+        ctx.declared_vars["x"] = VarDirection.TEMP
         stmts = compile_stmts("x = 10", ctx)
         assert len(stmts) == 1
         assert stmts[0].target.name == "x"
 
     def test_bare_name_undeclared_raises(self):
-        import pytest
         from plx.framework._compiler import CompileError
         with pytest.raises(CompileError, match="Undeclared variable"):
             compile_stmts("x = 10")
@@ -63,24 +61,21 @@ class TestAssignment:
 # ---------------------------------------------------------------------------
 
 class TestAugAssign:
-    def test_add_assign(self):
-        stmts = compile_stmts("self.x += 1")
+    @pytest.mark.parametrize("src, op", [
+        ("self.x += 1", BinaryOp.ADD),
+        ("self.x -= 5", BinaryOp.SUB),
+        ("self.x *= 2", BinaryOp.MUL),
+    ])
+    def test_aug_assign(self, src, op):
+        stmts = compile_stmts(src)
         assert len(stmts) == 1
         stmt = stmts[0]
         assert isinstance(stmt, Assignment)
         assert isinstance(stmt.value, BinaryExpr)
-        assert stmt.value.op == BinaryOp.ADD
+        assert stmt.value.op == op
         assert isinstance(stmt.value.left, VariableRef)
         assert stmt.value.left.name == "x"
 
-    def test_sub_assign(self):
-        stmts = compile_stmts("self.x -= 5")
-        assert stmts[0].value.op == BinaryOp.SUB
-
-    def test_mul_assign(self):
-        stmts = compile_stmts("self.x *= 2")
-        assert stmts[0].value.op == BinaryOp.MUL
-
 
 # ---------------------------------------------------------------------------
 # Annotated assignment (temp vars)
@@ -97,8 +92,7 @@ class TestAnnAssign:
         stmts = compile_stmts("x: REAL")
         assert len(stmts) == 0
 
-    def test_typed_temp_registers_var(self):
-        ctx = CompileContext()
+    def test_typed_temp_registers_var(self, ctx):
         compile_stmts("x: DINT = 0", ctx)
         assert "x" in ctx.declared_vars
         assert ctx.declared_vars["x"] == VarDirection.TEMP
@@ -106,8 +100,7 @@ class TestAnnAssign:
         assert ctx.generated_temp_vars[0].name == "x"
         assert ctx.generated_temp_vars[0].data_type == PrimitiveTypeRef(type=PrimitiveType.DINT)
 
-    def test_typed_temp_allows_subsequent_assign(self):
-        ctx = CompileContext()
+    def test_typed_temp_allows_subsequent_assign(self, ctx):
         stmts = compile_stmts("x: INT = 0\nx = 42", ctx)
         assert len(stmts) == 2
 
@@ -117,29 +110,18 @@ class TestAnnAssign:
 # ---------------------------------------------------------------------------
 
 class TestIfStatement:
-    def test_simple_if(self):
-        stmts = compile_stmts("""\
+    @pytest.mark.parametrize("src, n_elsif, n_else", [
+        pytest.param("""\
 if self.sensor:
     self.output = True
-""")
-        assert len(stmts) == 1
-        stmt = stmts[0]
-        assert isinstance(stmt, IfStatement)
-        assert isinstance(stmt.if_branch.condition, VariableRef)
-        assert len(stmt.if_branch.body) == 1
-
-    def test_if_else(self):
-        stmts = compile_stmts("""\
+""", 0, 0, id="if"),
+        pytest.param("""\
 if self.sensor:
     self.output = True
 else:
     self.output = False
-""")
-        stmt = stmts[0]
-        assert len(stmt.else_body) == 1
-
-    def test_if_elif_else(self):
-        stmts = compile_stmts("""\
+""", 0, 1, id="if_else"),
+        pytest.param("""\
 if self.a:
     self.x = 1
 elif self.b:
@@ -148,11 +130,17 @@ elif self.c:
     self.x = 3
 else:
     self.x = 0
-""")
-        stmt = stmts[0]
-        assert isinstance(stmt, IfStatement)
-        assert len(stmt.elsif_branches) == 2
-        assert len(stmt.else_body) == 1
+""", 2, 1, id="if_elif_else"),
+    ])
+    def test_branches(self, src, n_elsif, n_else):
+        (stmt,) = compile_stmts(src)
+        assert (
+            type(stmt),
+            type(stmt.if_branch.condition),
+            len(stmt.if_branch.body),
+            len(stmt.elsif_branches),
+            len(stmt.else_body),
+        ) == (IfStatement, VariableRef, 1, n_elsif, n_else)
 
     def test_nested_if(self):
         stmts = compile_stmts("""\
@@ -169,40 +157,38 @@ if self.a:
 # ---------------------------------------------------------------------------
 
 class TestForStatement:
-    def test_range_one_arg(self):
-        stmts = compile_stmts("""\
-for i in range(10):
+    @pytest.mark.parametrize("header, from_value, to_value, has_by", [
+        pytest.param("range(10)", "0", "9", False, id="one_arg"),
+        pytest.param("range(1, 10)", "1", "9", False, id="two_args"),
+        pytest.param("range(0, 20, 2)", "0", "19", True, id="three_args"),
+    ])
+    def test_range(self, header, from_value, to_value, has_by):
+        stmts = compile_stmts(f"""\
+for i in {header}:
     self.x = i
 """)
-        assert len(stmts) == 1
-        stmt = stmts[0]
-        assert isinstance(stmt, ForStatement)
-        assert stmt.loop_var == "i"
-        assert isinstance(stmt.from_expr, LiteralExpr)
-        assert stmt.from_expr.value == "0"
-        # to_expr = 10 - 1
-        assert isinstance(stmt.to_expr, BinaryExpr)
-        assert stmt.by_expr is None
-
-    def test_range_two_args(self):
-        stmts = compile_stmts("""\
-for i in range(1, 10):
+        (stmt,) = stmts
+        # Literal stop folds: to_expr = stop - 1
+        assert (
+            type(stmt),
+            stmt.loop_var,
+            type(stmt.from_expr),
+            stmt.from_expr.value,
+            type(stmt.to_expr),
+            stmt.to_expr.value,
+            stmt.by_expr is not None,
+        ) == (ForStatement, "i", LiteralExpr, from_value, LiteralExpr, to_value, has_by)
+
+    def test_range_variable_stop(self):
+        (stmt,) = compile_stmts("""\
+for i in range(self.n):
     self.x = i
 """)
-        stmt = stmts[0]
-        assert isinstance(stmt.from_expr, LiteralExpr)
-        assert stmt.from_expr.value == "1"
-
-    def test_range_three_args(self):
-        stmts = compile_stmts("""\
-for i in range(0, 20, 2):
-    self.x = i
-""")
-        stmt = stmts[0]
-        assert stmt.by_expr is not None
+        assert isinstance(stmt.to_expr, BinaryExpr)
+        assert stmt.to_expr.op == BinaryOp.SUB
+        assert stmt.to_expr.left == VariableRef(name="n")
 
-    def test_loop_var_auto_declared(self):
-        ctx = CompileContext()
+    def test_loop_var_auto_declared(self, ctx):
         compile_stmts("""\
 for i in range(10):
     self.x = i
@@ -243,13 +229,12 @@ match self.state:
     case _:
         self.x = 0
 """)
-        assert len(stmts) == 1
-        stmt = stmts[0]
-        assert isinstance(stmt, CaseStatement)
-        assert len(stmt.branches) == 2
-        assert stmt.branches[0].values == [0]
-        assert stmt.branches[1].values == [1]
-        assert len(stmt.else_body) == 1
+        (stmt,) = stmts
+        assert (
+            type(stmt),
+            [b.values for b in stmt.branches],
+            len(stmt.else_body),
+        ) == (CaseStatement, [(0,), (1,)], 1)
 
     def test_or_pattern(self):
         stmts = compile_stmts("""\
@@ -260,7 +245,7 @@ match self.state:
         self.x = 0
 """)
         stmt = stmts[0]
-        assert stmt.branches[0].values == [1, 2, 3]
+        assert stmt.branches[0].values == (1, 2, 3)
 
     def test_no_wildcard(self):
         stmts = compile_stmts("""\
@@ -271,8 +256,7 @@ match self.state:
         self.x = 2
 """)
         stmt = stmts[0]
-        assert len(stmt.branches) == 2
-        assert len(stmt.else_body) == 0
+        assert (len(stmt.branches), len(stmt.else_body)) == (2, 0)
 
 
 # ---------------------------------------------------------------------------
@@ -1,4 +1,4 @@
-"""Tests for @struct and @enumeration decorators."""
+"""Tests for @struct and @enumeration types used from FBs and projects."""
 
 import pytest
 
@@ -10,256 +10,35 @@ from plx.framework._data_types import (
     enumeration,
     struct,
 )
-from plx.framework._decorators import fb, program
+from plx.framework._decorators import fb, method
 from plx.framework._descriptors import input_var, output_var, static_var
 from plx.framework._project import project
 from plx.framework._types import (
     ARRAY,
     BOOL,
-    DINT,
     INT,
     REAL,
     _resolve_type_ref,
 )
-from plx.model.expressions import BinaryExpr, BinaryOp, LiteralExpr, VariableRef
-from plx.model.pou import POU
+from plx.model.expressions import BinaryExpr, BinaryOp, LiteralExpr
 from plx.model.statements import Assignment, CaseStatement
-from plx.model.types import (
-    EnumType,
-    NamedTypeRef,
-    PrimitiveType,
-    PrimitiveTypeRef,
-    StructMember,
-    StructType,
-)
+from plx.model.types import NamedTypeRef
 
 
 # ---------------------------------------------------------------------------
-# @struct
+# Shared definitions
 # ---------------------------------------------------------------------------
 
-class TestStruct:
-    def test_basic_struct(self):
-        @struct
-        class MotorData:
-            speed: REAL = 0.0
-            running: BOOL = False
-            fault_code: INT = 0
-
-        compiled = MotorData.compile()
-        assert isinstance(compiled, StructType)
-        assert compiled.name == "MotorData"
-        assert len(compiled.members) == 3
-
-    def test_member_names(self):
-        @struct
-        class Pair:
-            x: REAL = 0.0
-            y: REAL = 0.0
-
-        compiled = Pair.compile()
-        assert compiled.members[0].name == "x"
-        assert compiled.members[1].name == "y"
-
-    def test_member_types(self):
-        @struct
-        class Mixed:
-            flag: BOOL = True
-            count: DINT = 0
-            value: REAL = 1.5
+@fb
+class _EmptyFB:
+    def logic(self):
+        pass
 
-        compiled = Mixed.compile()
-        assert compiled.members[0].data_type == PrimitiveTypeRef(type=PrimitiveType.BOOL)
-        assert compiled.members[1].data_type == PrimitiveTypeRef(type=PrimitiveType.DINT)
-        assert compiled.members[2].data_type == PrimitiveTypeRef(type=PrimitiveType.REAL)
 
-    def test_member_defaults(self):
-        @struct
-        class WithDefaults:
-            speed: REAL = 1500.0
-            running: BOOL = True
-            code: INT = 42
-
-        compiled = WithDefaults.compile()
-        assert compiled.members[0].initial_value == "1500.0"
-        assert compiled.members[1].initial_value == "TRUE"
-        assert compiled.members[2].initial_value == "42"
-
-    def test_no_defaults(self):
-        @struct
-        class NoDefaults:
-            x: REAL
-            y: REAL
-
-        compiled = NoDefaults.compile()
-        assert compiled.members[0].initial_value is None
-        assert compiled.members[1].initial_value is None
-
-    def test_nested_struct_type(self):
-        @struct
-        class Inner:
-            value: REAL = 0.0
-
-        @struct
-        class Outer:
-            data: Inner
-
-        compiled = Outer.compile()
-        assert compiled.members[0].data_type == NamedTypeRef(name="Inner")
-
-    def test_array_member(self):
-        @struct
-        class WithArray:
-            values: ARRAY(REAL, 10)
-
-        compiled = WithArray.compile()
-        assert compiled.members[0].data_type.kind == "array"
-
-    def test_empty_struct_error(self):
-        with pytest.raises(TypeError, match="no annotated members"):
-            @struct
-            class Empty:
-                pass
-
-    def test_struct_marker(self):
-        @struct
-        class Marked:
-            x: INT = 0
-
-        assert _is_struct(Marked)
-        assert not _is_enumeration(Marked)
-        assert _is_data_type(Marked)
-
-    def test_struct_json_roundtrip(self):
-        @struct
-        class RoundTrip:
-            a: BOOL = True
-            b: INT = 5
-
-        compiled = RoundTrip.compile()
-        json_str = compiled.model_dump_json()
-        restored = StructType.model_validate_json(json_str)
-        assert restored == compiled
-
-    def test_compiled_type_attribute(self):
-        @struct
-        class HasAttr:
-            x: REAL = 0.0
-
-        assert hasattr(HasAttr, '_compiled_type')
-        assert isinstance(HasAttr._compiled_type, StructType)
-
-
-# ---------------------------------------------------------------------------
-# @enumeration
-# ---------------------------------------------------------------------------
-
-class TestEnum:
-    def test_basic_enum(self):
-        @enumeration
-        class MachineState:
-            STOPPED = 0
-            RUNNING = 1
-            FAULTED = 2
-
-        compiled = MachineState.compile()
-        assert isinstance(compiled, EnumType)
-        assert compiled.name == "MachineState"
-        assert len(compiled.members) == 3
-
-    def test_member_values(self):
-        @enumeration
-        class State:
-            OFF = 0
-            ON = 1
-
-        compiled = State.compile()
-        assert compiled.members[0].name == "OFF"
-        assert compiled.members[0].value == 0
-        assert compiled.members[1].name == "ON"
-        assert compiled.members[1].value == 1
-
-    def test_base_type(self):
-        @enumeration(base_type=DINT)
-        class AlarmCode:
-            NONE = 0
-            OVERHEAT = 100
-
-        compiled = AlarmCode.compile()
-        assert compiled.base_type == PrimitiveType.DINT
-
-    def test_no_base_type(self):
-        @enumeration
-        class Simple:
-            A = 0
-            B = 1
-
-        compiled = Simple.compile()
-        assert compiled.base_type is None
-
-    def test_empty_enum_error(self):
-        with pytest.raises(TypeError, match="has no members"):
-            @enumeration
-            class Empty:
-                pass
-
-    def test_non_int_member_error(self):
-        with pytest.raises(TypeError, match="must be an int"):
-            @enumeration
-            class Bad:
-                GOOD = 0
-                BAD = "hello"
-
-    def test_enum_marker(self):
-        @enumeration
-        class Marked:
-            A = 0
-
-        assert _is_enumeration(Marked)
-        assert not _is_struct(Marked)
-        assert _is_data_type(Marked)
-
-    def test_enum_values_dict(self):
-        @enumeration
-        class Colors:
-            RED = 0
-            GREEN = 1
-            BLUE = 2
-
-        assert Colors._enum_values == {"RED": 0, "GREEN": 1, "BLUE": 2}
-
-    def test_enum_json_roundtrip(self):
-        @enumeration
-        class RoundTrip:
-            X = 10
-            Y = 20
-
-        compiled = RoundTrip.compile()
-        json_str = compiled.model_dump_json()
-        restored = EnumType.model_validate_json(json_str)
-        assert restored == compiled
-
-    def test_enum_with_parentheses_no_args(self):
-        @enumeration()
-        class NoArgs:
-            A = 0
-            B = 1
-
-        compiled = NoArgs.compile()
-        assert compiled.name == "NoArgs"
-        assert compiled.base_type is None
-
-    def test_enum_non_contiguous_values(self):
-        @enumeration
-        class Sparse:
-            FIRST = 0
-            SECOND = 10
-            THIRD = 100
-
-        compiled = Sparse.compile()
-        assert compiled.members[0].value == 0
-        assert compiled.members[1].value == 10
-        assert compiled.members[2].value == 100
+@enumeration
+class State:
+    OFF = 0
+    ON = 1
 
 
 # ---------------------------------------------------------------------------
@@ -345,45 +124,128 @@ class TestDataTypeAsTypeArg:
 # Enum literals in logic()
 # ---------------------------------------------------------------------------
 
-class TestEnumInLogic:
-    def test_enum_attribute_access(self):
-        @enumeration
-        class Color:
-            RED = 0
-            GREEN = 1
-            BLUE = 2
+@pytest.fixture(scope="module")
+def uses_color_pou():
+    @enumeration
+    class Color:
+        RED = 0
+        GREEN = 1
+        BLUE = 2
+
+    @fb
+    class UsesColor:
+        out = output_var(INT)
+
+        def logic(self):
+            self.out = Color.GREEN
+
+    return UsesColor.compile()
+
+
+@pytest.fixture(scope="module")
+def checker_pou():
+    @fb
+    class Checker:
+        state = input_var(INT)
+        active = output_var(BOOL)
+
+        def logic(self):
+            if self.state == State.ON:
+                self.active = True
+
+    return Checker.compile()
+
+
+@pytest.fixture(scope="module")
+def state_machine_pou():
+    @enumeration
+    class Phase:
+        IDLE = 0
+        RUNNING = 1
+        DONE = 2
+
+    @fb
+    class StateMachine:
+        phase = static_var(INT, initial=0)
+        out = output_var(INT)
+
+        def logic(self):
+            match self.phase:
+                case Phase.IDLE:
+                    self.out = 0
+                case Phase.RUNNING:
+                    self.out = 1
+                case Phase.DONE:
+                    self.out = 2
+
+    return StateMachine.compile()
+
+
+@pytest.fixture(scope="module")
+def handler_pou():
+    @enumeration
+    class Status:
+        OK = 0
+        WARN = 1
+        ERROR = 2
+
+    @fb
+    class Handler:
+        status = static_var(INT, initial=0)
+        alarm = output_var(BOOL)
+
+        def logic(self):
+            match self.status:
+                case Status.WARN | Status.ERROR:
+                    self.alarm = True
+                case _:
+                    self.alarm = False
+
+    return Handler.compile()
+
+
+@pytest.fixture(scope="module")
+def with_method_pou():
+    @enumeration
+    class Cmd:
+        START = 0
+        STOP = 1
+
+    @fb
+    class WithMethod:
+        cmd = static_var(INT, initial=0)
+
+        def logic(self):
+            pass
 
-        @fb
-        class UsesColor:
-            out = output_var(INT)
+        @method
+        def set_cmd(self):
+            self.cmd = Cmd.START
 
-            def logic(self):
-                self.out = Color.GREEN
+    return WithMethod.compile()
+
+
+def _assert_unknown_enum_member(logic) -> None:
+    """Decorate an FB around *logic* and expect the unknown-member error."""
+    namespace = {
+        "out": output_var(INT),
+        "val": static_var(INT, initial=0),
+        "logic": logic,
+    }
+    with pytest.raises(CompileError, match="not a member of enum"):
+        fb(type("Bad", (), namespace))
 
-        pou = UsesColor.compile()
-        stmt = pou.networks[0].statements[0]
+
+class TestEnumInLogic:
+    def test_enum_attribute_access(self, uses_color_pou):
+        stmt = uses_color_pou.networks[0].statements[0]
         assert isinstance(stmt, Assignment)
         assert isinstance(stmt.value, LiteralExpr)
         assert stmt.value.value == "Color#GREEN"
         assert stmt.value.data_type == NamedTypeRef(name="Color")
 
-    def test_enum_comparison(self):
-        @enumeration
-        class State:
-            OFF = 0
-            ON = 1
-
-        @fb
-        class Checker:
-            state = input_var(INT)
-            active = output_var(BOOL)
-
-            def logic(self):
-                if self.state == State.ON:
-                    self.active = True
-
-        pou = Checker.compile()
-        stmt = pou.networks[0].statements[0]
+    def test_enum_comparison(self, checker_pou):
+        stmt = checker_pou.networks[0].statements[0]
         # If statement with enum comparison
         cond = stmt.if_branch.condition
         assert isinstance(cond, BinaryExpr)
@@ -391,108 +253,34 @@ class TestEnumInLogic:
         assert isinstance(cond.right, LiteralExpr)
         assert cond.right.value == "State#ON"
 
-    def test_enum_match_case(self):
-        @enumeration
-        class Phase:
-            IDLE = 0
-            RUNNING = 1
-            DONE = 2
-
-        @fb
-        class StateMachine:
-            phase = static_var(INT, initial=0)
-            out = output_var(INT)
-
-            def logic(self):
-                match self.phase:
-                    case Phase.IDLE:
-                        self.out = 0
-                    case Phase.RUNNING:
-                        self.out = 1
-                    case Phase.DONE:
-                        self.out = 2
-
-        pou = StateMachine.compile()
-        stmt = pou.networks[0].statements[0]
+    def test_enum_match_case(self, state_machine_pou):
+        stmt = state_machine_pou.networks[0].statements[0]
         assert isinstance(stmt, CaseStatement)
-        assert stmt.branches[0].values == [0]  # Phase.IDLE
-        assert stmt.branches[1].values == [1]  # Phase.RUNNING
-        assert stmt.branches[2].values == [2]  # Phase.DONE
+        assert stmt.branches[0].values == (0,)  # Phase.IDLE
+        assert stmt.branches[1].values == (1,)  # Phase.RUNNING
+        assert stmt.branches[2].values == (2,)  # Phase.DONE
 
-    def test_enum_match_case_or(self):
-        @enumeration
-        class Status:
-            OK = 0
-            WARN = 1
-            ERROR = 2
-
-        @fb
-        class Handler:
-            status = static_var(INT, initial=0)
-            alarm = output_var(BOOL)
-
-            def logic(self):
-                match self.status:
-                    case Status.WARN | Status.ERROR:
-                        self.alarm = True
-                    case _:
-                        self.alarm = False
-
-        pou = Handler.compile()
-        stmt = pou.networks[0].statements[0]
+    def test_enum_match_case_or(self, handler_pou):
+        stmt = handler_pou.networks[0].statements[0]
         assert isinstance(stmt, CaseStatement)
-        assert stmt.branches[0].values == [1, 2]  # WARN | ERROR
+        assert stmt.branches[0].values == (1, 2)  # WARN | ERROR
 
     def test_unknown_enum_member_error(self):
-        @enumeration
-        class Valid:
-            A = 0
-            B = 1
-
-        with pytest.raises(CompileError, match="not a member of enum"):
-            @fb
-            class Bad:
-                out = output_var(INT)
+        def logic(self):
+            self.out = State.NONEXISTENT
 
-                def logic(self):
-                    self.out = Valid.NONEXISTENT
+        _assert_unknown_enum_member(logic)
 
     def test_unknown_enum_member_in_match(self):
-        @enumeration
-        class Known:
-            X = 0
-
-        with pytest.raises(CompileError, match="not a member of enum"):
-            @fb
-            class BadMatch:
-                val = static_var(INT, initial=0)
+        def logic(self):
+            match self.val:
+                case State.MISSING:
+                    pass
 
-                def logic(self):
-                    match self.val:
-                        case Known.MISSING:
-                            pass
-
-    def test_enum_in_method(self):
-        from plx.framework._decorators import method
-
-        @enumeration
-        class Cmd:
-            START = 0
-            STOP = 1
-
-        @fb
-        class WithMethod:
-            cmd = static_var(INT, initial=0)
+        _assert_unknown_enum_member(logic)
 
-            def logic(self):
-                pass
-
-            @method
-            def set_cmd(self):
-                self.cmd = Cmd.START
-
-        pou = WithMethod.compile()
-        m = pou.methods[0]
+    def test_enum_in_method(self, with_method_pou):
+        m = with_method_pou.methods[0]
         stmt = m.networks[0].statements[0]
         assert isinstance(stmt, Assignment)
         assert isinstance(stmt.value, LiteralExpr)
@@ -503,57 +291,32 @@ class TestEnumInLogic:
 # Project with data types
 # ---------------------------------------------------------------------------
 
-class TestProjectWithDataTypes:
-    def test_project_with_struct(self):
-        @struct
-        class ProjStruct:
-            val: INT = 0
-
-        @fb
-        class ProjFB:
-            def logic(self):
-                pass
-
-        proj = project("Test", pous=[ProjFB], data_types=[ProjStruct])
-        ir = proj.compile()
-        assert len(ir.data_types) == 1
-        assert ir.data_types[0].name == "ProjStruct"
-        assert ir.data_types[0].kind == "struct"
+@pytest.fixture(scope="module")
+def mixed_ir():
+    @struct
+    class MixedStruct:
+        x: REAL = 0.0
 
-    def test_project_with_enum(self):
-        @enumeration
-        class ProjEnum:
-            A = 0
-            B = 1
+    @enumeration
+    class MixedEnum:
+        A = 0
 
-        @fb
-        class ProjFB2:
-            def logic(self):
-                pass
+    return project("Test", pous=[_EmptyFB], data_types=[MixedStruct, MixedEnum]).compile()
 
-        proj = project("Test", pous=[ProjFB2], data_types=[ProjEnum])
-        ir = proj.compile()
-        assert len(ir.data_types) == 1
-        assert ir.data_types[0].name == "ProjEnum"
-        assert ir.data_types[0].kind == "enum"
 
-    def test_project_with_mixed(self):
-        @struct
-        class MixedStruct:
-            x: REAL = 0.0
-
-        @enumeration
-        class MixedEnum:
-            A = 0
+class TestProjectWithDataTypes:
+    def test_project_with_struct(self, mixed_ir):
+        struct_type = mixed_ir.data_types[0]
+        assert struct_type.name == "MixedStruct"
+        assert struct_type.kind == "struct"
 
-        @fb
-        class MixedFB:
-            def logic(self):
-                pass
+    def test_project_with_enum(self, mixed_ir):
+        enum_type = mixed_ir.data_types[1]
+        assert enum_type.name == "MixedEnum"
+        assert enum_type.kind == "enum"
 
-        proj = project("Test", pous=[MixedFB], data_types=[MixedStruct, MixedEnum])
-        ir = proj.compile()
-        assert len(ir.data_types) == 2
+    def test_project_with_mixed(self, mixed_ir):
+        assert len(mixed_ir.data_types) == 2
 
     def test_project_non_data_type_error(self):
         class NotDecorated:
@@ -564,12 +327,7 @@ class TestProjectWithDataTypes:
             proj.compile()
 
     def test_project_no_data_types(self):
-        @fb
-        class NoDT:
-            def logic(self):
-                pass
-
-        proj = project("Test", pous=[NoDT])
+        proj = project("Test", pous=[_EmptyFB])
         ir = proj.compile()
         assert ir.data_types == []
 
@@ -578,73 +336,17 @@ class TestProjectWithDataTypes:
 # Introspection helpers
 # ---------------------------------------------------------------------------
 
-class TestIntrospectionHelpers:
-    def test_is_struct_on_plain_class(self):
-        class Plain:
-            pass
-        assert not _is_struct(Plain)
-
-    def test_is_enum_on_plain_class(self):
-        class Plain:
-            pass
-        assert not _is_enumeration(Plain)
-
-    def test_is_data_type_on_plain_class(self):
-        class Plain:
-            pass
-        assert not _is_data_type(Plain)
-
-    def test_is_struct_not_on_fb(self):
-        @fb
-        class SomeFB:
-            def logic(self):
-                pass
-        assert not _is_struct(SomeFB)
-        assert not _is_enumeration(SomeFB)
-
-
-# ---------------------------------------------------------------------------
-# folder= kwarg
-# ---------------------------------------------------------------------------
-
-class TestDataTypeFolderKwarg:
-    def test_struct_folder(self):
-        @struct(folder="types/motor")
-        class FolderStruct:
-            speed: REAL = 0.0
-            running: BOOL = False
-
-        assert FolderStruct.compile().folder == "types/motor"
-
-    def test_struct_bare_default_folder(self):
-        @struct
-        class BareStruct:
-            x: INT = 0
-
-        assert BareStruct.compile().folder == ""
-
-    def test_enum_folder(self):
-        @enumeration(folder="types/enums")
-        class FolderEnum:
-            A = 0
-            B = 1
+class _Plain:
+    pass
 
-        assert FolderEnum.compile().folder == "types/enums"
 
-    def test_enum_bare_default_folder(self):
-        @enumeration
-        class BareEnum:
-            X = 0
-            Y = 1
-
-        assert BareEnum.compile().folder == ""
-
-    def test_enum_with_base_type_and_folder(self):
-        @enumeration(base_type=DINT, folder="enums")
-        class TypedFolderEnum:
-            LOW = 0
-            HIGH = 100
-
-        compiled = TypedFolderEnum.compile()
-        assert compiled.folder == "enums"
-        assert compiled.base_type == PrimitiveType.DINT
+class TestIntrospectionHelpers:
+    @pytest.mark.parametrize("obj, predicate", [
+        pytest.param(_Plain, _is_struct, id="struct_on_plain_class"),
+        pytest.param(_Plain, _is_enumeration, id="enum_on_plain_class"),
+        pytest.param(_Plain, _is_data_type, id="data_type_on_plain_class"),
+        pytest.param(_EmptyFB, _is_struct, id="struct_not_on_fb"),
+        pytest.param(_EmptyFB, _is_enumeration, id="enum_not_on_fb"),
+    ])
+    def test_predicate_false(self, obj, predicate):
+        assert not predicate(obj)
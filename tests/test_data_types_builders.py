@@ -0,0 +1,308 @@
+"""Tests for @struct and @enumeration decorators — the compiled type definitions."""
+
+import pytest
+
+from plx.framework._data_types import (
+    _is_data_type,
+    _is_enumeration,
+    _is_struct,
+    enumeration,
+    struct,
+)
+from plx.framework._types import ARRAY, BOOL, DINT, INT, REAL
+from plx.model.types import (
+    EnumType,
+    NamedTypeRef,
+    PrimitiveType,
+    PrimitiveTypeRef,
+    StructType,
+)
+
+
+_BOOL = PrimitiveTypeRef(type=PrimitiveType.BOOL)
+_DINT = PrimitiveTypeRef(type=PrimitiveType.DINT)
+_REAL = PrimitiveTypeRef(type=PrimitiveType.REAL)
+
+
+# ---------------------------------------------------------------------------
+# Shared data types
+# ---------------------------------------------------------------------------
+# Decorated once at import; the tests below only read their compiled IR.
+
+@struct
+class MotorData:
+    speed: REAL = 0.0
+    running: BOOL = False
+    fault_code: INT = 0
+
+
+@struct
+class Pair:
+    x: REAL = 0.0
+    y: REAL = 0.0
+
+
+@struct
+class Mixed:
+    flag: BOOL = True
+    count: DINT = 0
+    value: REAL = 1.5
+
+
+@struct
+class WithDefaults:
+    speed: REAL = 1500.0
+    running: BOOL = True
+    code: INT = 42
+
+
+@struct
+class NoDefaults:
+    x: REAL
+    y: REAL
+
+
+@struct
+class Inner:
+    value: REAL = 0.0
+
+
+@struct
+class Outer:
+    data: Inner
+
+
+@struct
+class WithArray:
+    values: ARRAY(REAL, 10)
+
+
+@struct
+class StructRoundTrip:
+    a: BOOL = True
+    b: INT = 5
+
+
+@enumeration
+class MachineState:
+    STOPPED = 0
+    RUNNING = 1
+    FAULTED = 2
+
+
+@enumeration
+class State:
+    OFF = 0
+    ON = 1
+
+
+@enumeration(base_type=DINT)
+class AlarmCode:
+    NONE = 0
+    OVERHEAT = 100
+
+
+@enumeration
+class Colors:
+    RED = 0
+    GREEN = 1
+    BLUE = 2
+
+
+@enumeration
+class EnumRoundTrip:
+    X = 10
+    Y = 20
+
+
+@enumeration()
+class NoArgs:
+    A = 0
+    B = 1
+
+
+@enumeration
+class Sparse:
+    FIRST = 0
+    SECOND = 10
+    THIRD = 100
+
+
+# ---------------------------------------------------------------------------
+# @struct
+# ---------------------------------------------------------------------------
+
+class TestStruct:
+    def test_basic_struct(self):
+        compiled = MotorData.compile()
+        assert isinstance(compiled, StructType)
+        assert compiled.name == "MotorData"
+        assert len(compiled.members) == 3
+
+    def test_member_names(self):
+        compiled = Pair.compile()
+        assert compiled.members[0].name == "x"
+        assert compiled.members[1].name == "y"
+
+    def test_member_types(self):
+        compiled = Mixed.compile()
+        assert [m.data_type for m in compiled.members] == [_BOOL, _DINT, _REAL]
+
+    def test_member_defaults(self):
+        compiled = WithDefaults.compile()
+        assert compiled.members[0].initial_value == "1500.0"
+        assert compiled.members[1].initial_value == "TRUE"
+        assert compiled.members[2].initial_value == "42"
+
+    def test_no_defaults(self):
+        compiled = NoDefaults.compile()
+        assert compiled.members[0].initial_value is None
+        assert compiled.members[1].initial_value is None
+
+    def test_nested_struct_type(self):
+        compiled = Outer.compile()
+        assert compiled.members[0].data_type == NamedTypeRef(name="Inner")
+
+    def test_array_member(self):
+        compiled = WithArray.compile()
+        assert compiled.members[0].data_type.kind == "array"
+
+    def test_empty_struct_error(self):
+        with pytest.raises(TypeError, match="no annotated members"):
+            @struct
+            class Empty:
+                pass
+
+    def test_struct_marker(self):
+        assert _is_struct(Pair)
+        assert not _is_enumeration(Pair)
+        assert _is_data_type(Pair)
+
+    @pytest.mark.slow
+    def test_struct_json_roundtrip(self):
+        compiled = StructRoundTrip.compile()
+        restored = StructType.model_validate_json(compiled.model_dump_json())
+        assert restored == compiled
+
+    def test_compiled_type_attribute(self):
+        assert hasattr(Inner, '_compiled_type')
+        assert isinstance(Inner._compiled_type, StructType)
+
+    def test_compile_returns_cached_type(self):
+        assert MotorData.compile() is MotorData.compile()
+        assert MotorData.compile() is MotorData._compiled_type
+
+
+# ---------------------------------------------------------------------------
+# @enumeration
+# ---------------------------------------------------------------------------
+
+class TestEnum:
+    def test_basic_enum(self):
+        compiled = MachineState.compile()
+        assert isinstance(compiled, EnumType)
+        assert compiled.name == "MachineState"
+        assert len(compiled.members) == 3
+
+    def test_member_values(self):
+        compiled = State.compile()
+        assert compiled.members[0].name == "OFF"
+        assert compiled.members[0].value == 0
+        assert compiled.members[1].name == "ON"
+        assert compiled.members[1].value == 1
+
+    def test_base_type(self):
+        compiled = AlarmCode.compile()
+        assert compiled.base_type == PrimitiveType.DINT
+
+    def test_no_base_type(self):
+        compiled = State.compile()
+        assert compiled.base_type is None
+
+    def test_empty_enum_error(self):
+        with pytest.raises(TypeError, match="has no members"):
+            @enumeration
+            class Empty:
+                pass
+
+    def test_non_int_member_error(self):
+        with pytest.raises(TypeError, match="must be an int"):
+            @enumeration
+            class Bad:
+                GOOD = 0
+                BAD = "hello"
+
+    def test_enum_marker(self):
+        assert _is_enumeration(State)
+        assert not _is_struct(State)
+        assert _is_data_type(State)
+
+    def test_compile_returns_cached_type(self):
+        assert Colors.compile() is Colors._compiled_type
+
+    def test_enum_values_dict(self):
+        assert Colors._enum_values == {"RED": 0, "GREEN": 1, "BLUE": 2}
+
+    @pytest.mark.slow
+    def test_enum_json_roundtrip(self):
+        compiled = EnumRoundTrip.compile()
+        restored = EnumType.model_validate_json(compiled.model_dump_json())
+        assert restored == compiled
+
+    def test_enum_with_parentheses_no_args(self):
+        compiled = NoArgs.compile()
+        assert compiled.name == "NoArgs"
+        assert compiled.base_type is None
+
+    def test_enum_non_contiguous_values(self):
+        compiled = Sparse.compile()
+        assert compiled.members[0].value == 0
+        assert compiled.members[1].value == 10
+        assert compiled.members[2].value == 100
+
+
+# ---------------------------------------------------------------------------
+# folder= kwarg
+# ---------------------------------------------------------------------------
+
+class TestDataTypeFolderKwarg:
+    def test_struct_folder(self):
+        @struct(folder="types/motor")
+        class FolderStruct:
+            speed: REAL = 0.0
+            running: BOOL = False
+
+        assert FolderStruct.compile().folder == "types/motor"
+
+    def test_struct_bare_default_folder(self):
+        @struct
+        class BareStruct:
+            x: INT = 0
+
+        assert BareStruct.compile().folder == ""
+
+    def test_enum_folder(self):
+        @enumeration(folder="types/enums")
+        class FolderEnum:
+            A = 0
+            B = 1
+
+        assert FolderEnum.compile().folder == "types/enums"
+
+    def test_enum_bare_default_folder(self):
+        @enumeration
+        class BareEnum:
+            X = 0
+            Y = 1
+
+        assert BareEnum.compile().folder == ""
+
+    def test_enum_with_base_type_and_folder(self):
+        @enumeration(base_type=DINT, folder="enums")
+        class TypedFolderEnum:
+            LOW = 0
+            HIGH = 100
+
+        compiled = TypedFolderEnum.compile()
+        assert compiled.folder == "enums"
+        assert compiled.base_type == PrimitiveType.DINT
@@ -1,8 +1,10 @@
 """Tests for POU decorators — end-to-end compilation."""
 
+import functools
+
 import pytest
 
-from plx.framework._compiler import CompileError
+from plx.framework._compiler import CompileError, CompileErrorCode
 from plx.framework._decorators import fb, function, program
 from plx.framework._descriptors import input_var, output_var, static_var, inout_var
 from plx.framework._types import BOOL, DINT, INT, REAL, TIME, T
@@ -18,6 +20,14 @@ from plx.model.statements import Assignment, FBInvocation, IfStatement
 from plx.model.types import NamedTypeRef, PrimitiveType, PrimitiveTypeRef
 
 
+def _passthrough(func):
+    """A ``functools.wraps`` decorator, as user code might put on logic()."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
 # ---------------------------------------------------------------------------
 # @fb
 # ---------------------------------------------------------------------------
@@ -42,6 +52,20 @@ class TestFBDecorator:
         assert len(pou.networks) == 1
         assert len(pou.networks[0].statements) == 1
 
+    def test_compile_reuses_class_pou(self):
+        """logic() is compiled once at decoration; compile() never recompiles."""
+        @fb
+        class OnceFB:
+            sensor = input_var(BOOL)
+            valve = output_var(BOOL)
+
+            def logic(self):
+                self.valve = self.sensor
+
+        pou = OnceFB.compile()
+        assert OnceFB.compile() is pou
+        assert OnceFB._compiled_pou is pou
+
     def test_fb_with_static(self):
         @fb
         class CounterFB:
@@ -80,6 +104,24 @@ class TestFBDecorator:
         assert isinstance(stmts[0], FBInvocation)
         assert stmts[0].fb_type == "TON"
 
+    def test_sentinel_instances_do_not_alias_type_ref(self):
+        from plx.framework._compiler import delayed
+
+        @fb
+        class TwoTimers:
+            a = input_var(BOOL)
+            b = input_var(BOOL)
+            x = output_var(BOOL)
+            y = output_var(BOOL)
+
+            def logic(self):
+                self.x = delayed(self.a, seconds=1)
+                self.y = delayed(self.b, seconds=2)
+
+        first, second = TwoTimers.compile().interface.static_vars
+        first.data_type.name = "TOF"
+        assert second.data_type == NamedTypeRef(name="TON")
+
     def test_fb_multiple_variables(self):
         @fb
         class MultiFB:
@@ -95,6 +137,21 @@ class TestFBDecorator:
         assert len(pou.interface.input_vars) == 3
         assert len(pou.interface.output_vars) == 1
 
+    def test_wrapped_logic_compiles_user_body(self):
+        @fb
+        class Wrapped:
+            x = input_var(BOOL)
+            y = output_var(BOOL)
+
+            @_passthrough
+            def logic(self):
+                self.y = self.x
+
+        stmts = Wrapped.compile().networks[0].statements
+        assert len(stmts) == 1
+        assert stmts[0].target == VariableRef(name="y")
+        assert stmts[0].value == VariableRef(name="x")
+
 
 # ---------------------------------------------------------------------------
 # @program
@@ -163,10 +220,11 @@ class TestFunctionDecorator:
 
 class TestDecoratorErrors:
     def test_missing_logic_method(self):
-        with pytest.raises(CompileError, match="must have a logic"):
+        with pytest.raises(CompileError) as exc_info:
             @fb
             class NoLogic:
                 x = input_var(BOOL)
+        assert exc_info.value.code is CompileErrorCode.NO_LOGIC
 
     def test_invalid_syntax_in_logic(self):
         with pytest.raises(CompileError):
@@ -178,34 +236,55 @@ class TestDecoratorErrors:
                     import os
 
     def test_logic_extra_param_rejected(self):
-        with pytest.raises(CompileError, match="must take exactly one parameter"):
+        with pytest.raises(CompileError) as exc_info:
             @fb
             class ExtraParam:
                 def logic(self, x):
                     pass
+        assert exc_info.value.code is CompileErrorCode.LOGIC_ARITY
 
     def test_logic_varargs_rejected(self):
-        with pytest.raises(CompileError, match="must take only 'self'"):
+        with pytest.raises(CompileError) as exc_info:
             @fb
             class VarArgs:
                 def logic(self, *args):
                     pass
+        assert exc_info.value.code is CompileErrorCode.MUST_TAKE_SELF_ONLY
 
     def test_logic_kwargs_rejected(self):
-        with pytest.raises(CompileError, match="must take only 'self'"):
+        with pytest.raises(CompileError) as exc_info:
             @fb
             class KwArgs:
                 def logic(self, **kwargs):
                     pass
+        assert exc_info.value.code is CompileErrorCode.MUST_TAKE_SELF_ONLY
+
+    def test_wrapped_logic_signature_checked_unwrapped(self):
+        from plx.framework._compilation_helpers import _validate_self_only
+
+        @_passthrough
+        def logic(self):
+            pass
+
+        _validate_self_only(logic, "logic()")
+
+        @_passthrough
+        def extra(self, x):
+            pass
+
+        with pytest.raises(CompileError) as exc_info:
+            _validate_self_only(extra, "extra()")
+        assert exc_info.value.code is CompileErrorCode.LOGIC_ARITY
 
     def test_function_missing_return_annotation(self):
-        with pytest.raises(CompileError, match="requires a return type"):
+        with pytest.raises(CompileError) as exc_info:
             @function
             class NoReturn:
                 x = input_var(REAL)
 
                 def logic(self):
                     return self.x + 1.0
+        assert exc_info.value.code is CompileErrorCode.MISSING_RETURN_TYPE
 
 
 # ---------------------------------------------------------------------------
@@ -369,39 +448,46 @@ class TestFunctionLanguage:
 
 class TestLanguageErrors:
     def test_sfc_rejected_on_fb(self):
-        with pytest.raises(CompileError, match="Use @sfc instead"):
+        with pytest.raises(CompileError) as exc_info:
             @fb(language="SFC")
             class SfcFB:
                 def logic(self):
                     pass
+        assert exc_info.value.code is CompileErrorCode.SFC_LANGUAGE
 
     def test_sfc_rejected_on_program(self):
-        with pytest.raises(CompileError, match="Use @sfc instead"):
+        with pytest.raises(CompileError) as exc_info:
             @program(language="SFC")
             class SfcProg:
                 def logic(self):
                     pass
+        assert exc_info.value.code is CompileErrorCode.SFC_LANGUAGE
 
     def test_sfc_rejected_on_function(self):
-        with pytest.raises(CompileError, match="Use @sfc instead"):
+        with pytest.raises(CompileError) as exc_info:
             @function(language="SFC")
             class SfcFunc:
                 def logic(self) -> BOOL:
                     pass
+        assert exc_info.value.code is CompileErrorCode.SFC_LANGUAGE
 
     def test_invalid_language_string(self):
-        with pytest.raises(CompileError, match="Invalid language 'IL'"):
+        with pytest.raises(CompileError) as exc_info:
             @fb(language="IL")
             class IlFB:
                 def logic(self):
                     pass
+        assert exc_info.value.code is CompileErrorCode.INVALID_LANGUAGE
+        assert "'IL'" in str(exc_info.value)
 
     def test_language_is_case_sensitive(self):
-        with pytest.raises(CompileError, match="Invalid language 'st'"):
+        with pytest.raises(CompileError) as exc_info:
             @fb(language="st")
             class LowercaseFB:
                 def logic(self):
                     pass
+        assert exc_info.value.code is CompileErrorCode.INVALID_LANGUAGE
+        assert "'st'" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
@@ -1,6 +1,9 @@
 """Tests for variable descriptors."""
 
+from enum import IntEnum
+
 import pytest
+from pydantic import ValidationError
 
 from plx.framework._descriptors import (
     VarDescriptor,
@@ -52,6 +55,12 @@ class TestFormatInitial:
     def test_string_passthrough(self):
         assert _format_initial("T#10s") == "T#10s"
 
+    def test_int_subclass(self):
+        class Level(IntEnum):
+            HIGH = 3
+
+        assert _format_initial(Level.HIGH) == "3"
+
     def test_invalid_type_raises(self):
         with pytest.raises(TypeError, match="Cannot convert"):
             _format_initial([1, 2, 3])
@@ -303,6 +312,30 @@ class TestCollectDescriptors:
         assert v.constant is False
         assert v.address is None
 
+    def test_child_extends_cached_parent(self):
+        class Parent:
+            a = input_var(PrimitiveType.BOOL)
+            b = output_var(PrimitiveType.BOOL)
+
+        _collect_descriptors(Parent)
+        assert [name for name, _ in Parent._plx_descriptors] == ["a", "b"]
+
+        class Child(Parent):
+            a = input_var(PrimitiveType.INT)
+            c = static_var(PrimitiveType.INT)
+
+        groups = _collect_descriptors(Child)
+        assert [v.name for v in groups["input"]] == ["a"]
+        assert groups["input"][0].data_type == PrimitiveTypeRef(type=PrimitiveType.INT)
+        assert [name for name, _ in Child._plx_descriptors] == ["b", "a", "c"]
+
+    def test_invalid_free_form_fields_rejected(self):
+        class MyFB:
+            x = input_var(PrimitiveType.BOOL, description=None)
+
+        with pytest.raises(ValidationError):
+            _collect_descriptors(MyFB)
+
 
 # ---------------------------------------------------------------------------
 # constant_var
@@ -1,97 +1,83 @@
 """Tests for auto-discovery and folder inference."""
 
+import sys
+from importlib.machinery import ModuleSpec
+from itertools import chain
+from types import ModuleType
+
 import pytest
 
+from plx.framework._decorators import fb
+from plx.framework._descriptors import input_var
 from plx.framework._discover import DiscoveryResult, _infer_folder, discover
 from plx.framework._project import PlxTask, project
 from plx.framework._protocols import CompiledDataType, CompiledGlobalVarList, CompiledPOU
+from plx.framework._types import BOOL
 
 
 # ---------------------------------------------------------------------------
 # _infer_folder
 # ---------------------------------------------------------------------------
 
-class TestInferFolder:
-    """Tests for _infer_folder() with various module structures."""
-
-    def test_root_package_init(self):
-        """Class in root package __init__.py → ''."""
-
-        class Fake:
-            __module__ = "my_machine"
-
-        assert _infer_folder(Fake, "my_machine") == ""
-
-    def test_root_level_module(self):
-        """Class in my_machine.types (regular file) → ''."""
-
-        class Fake:
-            __module__ = "my_machine.types"
-
-        assert _infer_folder(Fake, "my_machine") == ""
-
-    def test_subpackage_module(self):
-        """Class in my_machine.conveyors.belt → 'conveyors'."""
-
-        class Fake:
-            __module__ = "my_machine.conveyors.belt"
-
-        assert _infer_folder(Fake, "my_machine") == "conveyors"
-
-    def test_deep_subpackage_module(self):
-        """Class in my_machine.area1.conveyors.belt → 'area1/conveyors'."""
-
-        class Fake:
-            __module__ = "my_machine.area1.conveyors.belt"
-
-        assert _infer_folder(Fake, "my_machine") == "area1/conveyors"
-
-    def test_subpackage_init(self):
-        """Class in a package __init__.py → keeps all segments."""
-        import sys
-        from types import ModuleType
-
-        # Create a fake package module with __path__
-        mod = ModuleType("my_machine.conveyors")
-        mod.__path__ = ["/fake/path"]
-        sys.modules["my_machine.conveyors"] = mod
-        try:
-
-            class Fake:
-                __module__ = "my_machine.conveyors"
-
-            assert _infer_folder(Fake, "my_machine") == "conveyors"
-        finally:
-            del sys.modules["my_machine.conveyors"]
-
-    def test_different_root(self):
-        """Class from outside root package → ''."""
-
-        class Fake:
-            __module__ = "other_package.foo"
-
-        assert _infer_folder(Fake, "my_machine") == ""
+# Stand-in package module (has __path__) for the package-init case
+_FAKE_PKG = ModuleType("my_machine.conveyors")
+_FAKE_PKG.__path__ = ["/fake/path"]
+
+
+@pytest.mark.parametrize("module, expected", [
+    pytest.param("my_machine", "", id="root_package_init"),
+    pytest.param("my_machine.types", "", id="root_level_module"),
+    pytest.param("my_machine.conveyors.belt", "conveyors", id="subpackage_module"),
+    pytest.param("my_machine.area1.conveyors.belt", "area1/conveyors", id="deep_subpackage_module"),
+    pytest.param("other_package.foo", "", id="different_root"),
+    pytest.param("my_machine2.conveyors.belt", "", id="sibling_package_sharing_prefix"),
+])
+def test_infer_folder(module, expected):
+    fake = type("Fake", (), {"__module__": module})
+    assert _infer_folder(fake, "my_machine") == expected
+
+
+def test_infer_folder_subpackage_init(monkeypatch):
+    """Class in a package __init__.py → keeps all segments."""
+    monkeypatch.setitem(sys.modules, "my_machine.conveyors", _FAKE_PKG)
+    fake = type("Fake", (), {"__module__": "my_machine.conveyors"})
+    assert _infer_folder(fake, "my_machine") == "conveyors"
+
+
+@pytest.mark.parametrize("is_package, expected", [
+    pytest.param(True, "conveyors/belt", id="package"),
+    pytest.param(False, "conveyors", id="module"),
+])
+def test_infer_folder_spec_decides_package(monkeypatch, is_package, expected):
+    """An imported module's spec says whether it is a package."""
+    name = "my_machine.conveyors.belt"
+    mod = ModuleType(name)
+    mod.__spec__ = ModuleSpec(name, None, is_package=is_package)
+    monkeypatch.setitem(sys.modules, name, mod)
+    fake = type("Fake", (), {"__module__": name})
+    assert _infer_folder(fake, "my_machine") == expected
 
 
 # ---------------------------------------------------------------------------
 # discover() — integration with test fixture package
 # ---------------------------------------------------------------------------
 
+_EXPECTED_POUS = frozenset({"MainProgram", "BeltConveyor", "RollerConveyor"})
+_EXPECTED_TYPES = frozenset({"BeltData", "MotorData"})
+
+
 class TestDiscover:
     """Tests for discover() using the sample_project fixture."""
 
     def test_discovers_all_pous(self):
         result = discover("tests.fixtures.sample_project")
         pou_names = {cls.__name__ for cls in result.pous}
-        assert "MainProgram" in pou_names
-        assert "BeltConveyor" in pou_names
-        assert "RollerConveyor" in pou_names
+        assert _EXPECTED_POUS <= pou_names
 
     def test_discovers_data_types(self):
         result = discover("tests.fixtures.sample_project")
         type_names = {cls.__name__ for cls in result.data_types}
-        assert "BeltData" in type_names
-        assert "MotorData" in type_names
+        assert _EXPECTED_TYPES <= type_names
 
     def test_discovers_global_var_lists(self):
         result = discover("tests.fixtures.sample_project")
@@ -106,38 +92,22 @@ class TestDiscover:
     def test_folder_inference_conveyors(self):
         """POUs in conveyors/ subpackage get folder='conveyors'."""
         result = discover("tests.fixtures.sample_project")
-        for cls in result.pous:
-            if cls.__name__ == "BeltConveyor":
-                assert cls._compiled_pou.folder == "conveyors"
-                return
-        pytest.fail("BeltConveyor not found")
+        assert result.pous_by_name["BeltConveyor"]._compiled_pou.folder == "conveyors"
 
     def test_folder_inference_root_module(self):
         """Types in root-level types.py get folder=''."""
         result = discover("tests.fixtures.sample_project")
-        for cls in result.data_types:
-            if cls.__name__ == "MotorData":
-                assert cls._compiled_type.folder == ""
-                return
-        pytest.fail("MotorData not found")
+        assert result.data_types_by_name["MotorData"]._compiled_type.folder == ""
 
     def test_folder_inference_root_init(self):
         """POU in root __init__.py gets folder=''."""
         result = discover("tests.fixtures.sample_project")
-        for cls in result.pous:
-            if cls.__name__ == "MainProgram":
-                assert cls._compiled_pou.folder == ""
-                return
-        pytest.fail("MainProgram not found")
+        assert result.pous_by_name["MainProgram"]._compiled_pou.folder == ""
 
     def test_folder_inference_io_subpackage(self):
         """GVL in io/signals.py gets folder='io'."""
         result = discover("tests.fixtures.sample_project")
-        for cls in result.global_var_lists:
-            if cls.__name__ == "DigitalIO":
-                assert cls._compiled_gvl.folder == "io"
-                return
-        pytest.fail("DigitalIO not found")
+        assert result.gvls_by_name["DigitalIO"]._compiled_gvl.folder == "io"
 
     def test_deduplication(self):
         """Same package scanned twice doesn't produce duplicates."""
@@ -151,12 +121,11 @@ class TestDiscover:
 
     def test_excludes_external_imports(self):
         """Classes imported from outside the package are excluded."""
-        result = discover("tests.fixtures.sample_project")
+        prefix = "tests.fixtures.sample_project"
+        result = discover(prefix)
         # No classes from plx.framework or plx.model should appear
-        for cls in result.pous:
-            assert cls.__module__.startswith("tests.fixtures.sample_project")
-        for cls in result.data_types:
-            assert cls.__module__.startswith("tests.fixtures.sample_project")
+        for cls in chain(result.pous, result.data_types):
+            assert cls.__module__.startswith(prefix)
 
     def test_result_type(self):
         result = discover("tests.fixtures.sample_project")
@@ -172,10 +141,6 @@ class TestFolderOverride:
 
     def test_explicit_folder_preserved(self):
         """When a decorator sets folder=, discover() doesn't override it."""
-        from plx.framework._decorators import fb
-        from plx.framework._descriptors import input_var
-        from plx.framework._types import BOOL
-
         @fb(folder="custom/path")
         class ExplicitFolderFB:
             x = input_var(BOOL)
@@ -190,24 +155,25 @@ class TestFolderOverride:
 # project(packages=...)
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def sample_ir():
+    return project(
+        "TestProject",
+        packages=["tests.fixtures.sample_project"],
+    ).compile()
+
+
 class TestProjectPackages:
     """Tests for project(packages=...) integration."""
 
-    def test_project_with_packages(self):
-        proj = project(
-            "TestProject",
-            packages=["tests.fixtures.sample_project"],
-        )
-        ir = proj.compile()
+    def test_project_with_packages(self, sample_ir):
+        ir = sample_ir
 
         pou_names = {p.name for p in ir.pous}
-        assert "MainProgram" in pou_names
-        assert "BeltConveyor" in pou_names
-        assert "RollerConveyor" in pou_names
+        assert _EXPECTED_POUS <= pou_names
 
         type_names = {t.name for t in ir.data_types}
-        assert "BeltData" in type_names
-        assert "MotorData" in type_names
+        assert _EXPECTED_TYPES <= type_names
 
         gvl_names = {g.name for g in ir.global_variable_lists}
         assert "DigitalIO" in gvl_names
@@ -217,10 +183,6 @@ class TestProjectPackages:
 
     def test_project_packages_with_explicit_merge(self):
         """Explicit pous= merged with packages= discovered items."""
-        from plx.framework._decorators import fb
-        from plx.framework._descriptors import input_var
-        from plx.framework._types import BOOL
-
         @fb
         class ExtraFB:
             x = input_var(BOOL)
@@ -236,23 +198,13 @@ class TestProjectPackages:
         ir = proj.compile()
 
         pou_names = {p.name for p in ir.pous}
-        assert "ExtraFB" in pou_names
-        assert "MainProgram" in pou_names
-        assert "BeltConveyor" in pou_names
+        assert {"ExtraFB", "MainProgram", "BeltConveyor"} <= pou_names
 
-    def test_project_packages_folders_in_ir(self):
+    def test_project_packages_folders_in_ir(self, sample_ir):
         """Folder paths should appear in the compiled Project IR."""
-        proj = project(
-            "FolderProject",
-            packages=["tests.fixtures.sample_project"],
-        )
-        ir = proj.compile()
-
-        belt_pou = next(p for p in ir.pous if p.name == "BeltConveyor")
-        assert belt_pou.folder == "conveyors"
-
-        main_pou = next(p for p in ir.pous if p.name == "MainProgram")
-        assert main_pou.folder == ""
+        pous = {p.name: p for p in sample_ir.pous}
+        assert pous["BeltConveyor"].folder == "conveyors"
+        assert pous["MainProgram"].folder == ""
 
-        digital_gvl = next(g for g in ir.global_variable_lists if g.name == "DigitalIO")
-        assert digital_gvl.folder == "io"
+        gvls = {g.name: g for g in sample_ir.global_variable_lists}
+        assert gvls["DigitalIO"].folder == "io"
@@ -1,6 +1,13 @@
 """Tests for the ST pretty-printer (plx.export.st)."""
 
-from plx.export.st import _build_source_map, to_structured_text
+import pytest
+
+from plx.export.st import (
+    SourceMapEntry,
+    _build_source_map,
+    _variable_name_pattern,
+    to_structured_text,
+)
 from plx.model import (
     POU,
     POUType,
@@ -79,214 +86,131 @@ def _lit(val: str) -> LiteralExpr:
     return LiteralExpr(value=val)
 
 
-# -----------------------------------------------------------------------
-# Type references
-# -----------------------------------------------------------------------
+def _assign(target: str, literal: str) -> Assignment:
+    """``target := literal;``"""
+    return Assignment(target=_ref(target), value=_lit(literal))
 
-class TestTypeRef:
-    def test_primitive(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(input_vars=[Variable(name="x", data_type=_bool())]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "x : BOOL;" in st
 
-    def test_string(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(input_vars=[
-                Variable(name="s", data_type=StringTypeRef(max_length=80)),
-            ]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "s : STRING[80];" in st
+def _program(*stmts) -> POU:
+    """A bare PROGRAM whose single network holds *stmts*."""
+    return POU(
+        pou_type=POUType.PROGRAM, name="T",
+        networks=[Network(statements=list(stmts))],
+    )
 
-    def test_wstring(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(input_vars=[
-                Variable(name="s", data_type=StringTypeRef(wide=True)),
-            ]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "s : WSTRING;" in st
-
-    def test_array(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(static_vars=[
-                Variable(name="a", data_type=ArrayTypeRef(
-                    element_type=_int(),
-                    dimensions=[DimensionRange(lower=0, upper=9)],
-                )),
-            ]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "a : ARRAY[0..9] OF INT;" in st
 
-    def test_pointer(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(static_vars=[
-                Variable(name="p", data_type=PointerTypeRef(target_type=_int())),
-            ]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "p : POINTER TO INT;" in st
+def _program_st(*stmts) -> str:
+    return to_structured_text(_program(*stmts))
 
-    def test_reference(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(static_vars=[
-                Variable(name="r", data_type=ReferenceTypeRef(target_type=_real())),
-            ]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "r : REFERENCE TO REAL;" in st
 
-    def test_named(self):
-        pou = POU(
-            pou_type=POUType.FUNCTION_BLOCK, name="T",
-            interface=POUInterface(static_vars=[
-                Variable(name="m", data_type=NamedTypeRef(name="MotorData")),
-            ]),
-            networks=[],
-        )
-        st = to_structured_text(pou)
-        assert "m : MotorData;" in st
+def _assert_contains_all(st: str, needles) -> None:
+    """Assert every needle occurs in *st*, reporting all that are missing."""
+    missing = [n for n in needles if n not in st]
+    assert not missing, f"missing from output: {missing!r}\n{st}"
 
 
 # -----------------------------------------------------------------------
-# Expressions
+# Type references
 # -----------------------------------------------------------------------
 
-class TestExpressions:
-    def test_binary_arithmetic(self):
-        stmt = Assignment(
-            target=_ref("y"),
-            value=BinaryExpr(op=BinaryOp.ADD, left=_ref("a"), right=_lit("1")),
-        )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := a + 1;" in st
+# (interface section, variable, expected declaration) — all rendered from
+# one FB; each declaration line is unique.
+_TYPE_REF_CASES = [
+    pytest.param("input_vars", Variable(name="x", data_type=_bool()),
+                 "x : BOOL;", id="primitive"),
+    pytest.param("input_vars", Variable(name="s", data_type=StringTypeRef(max_length=80)),
+                 "s : STRING[80];", id="string"),
+    pytest.param("input_vars", Variable(name="s", data_type=StringTypeRef(wide=True)),
+                 "s : WSTRING;", id="wstring"),
+    pytest.param("static_vars", Variable(name="a", data_type=ArrayTypeRef(
+                     element_type=_int(),
+                     dimensions=[DimensionRange(lower=0, upper=9)],
+                 )),
+                 "a : ARRAY[0..9] OF INT;", id="array"),
+    pytest.param("static_vars", Variable(name="p", data_type=PointerTypeRef(target_type=_int())),
+                 "p : POINTER TO INT;", id="pointer"),
+    pytest.param("static_vars", Variable(name="r", data_type=ReferenceTypeRef(target_type=_real())),
+                 "r : REFERENCE TO REAL;", id="reference"),
+    pytest.param("static_vars", Variable(name="m", data_type=NamedTypeRef(name="MotorData")),
+                 "m : MotorData;", id="named"),
+]
+
+
+@pytest.fixture(scope="module")
+def type_ref_st() -> str:
+    sections: dict[str, list[Variable]] = {}
+    for case in _TYPE_REF_CASES:
+        section, var, _expected = case.values
+        sections.setdefault(section, []).append(var)
+    pou = POU(
+        pou_type=POUType.FUNCTION_BLOCK, name="T",
+        interface=POUInterface(**sections),
+        networks=[],
+    )
+    return to_structured_text(pou)
 
-    def test_binary_comparison(self):
-        stmt = Assignment(
-            target=_ref("y"),
-            value=BinaryExpr(op=BinaryOp.NE, left=_ref("a"), right=_ref("b")),
-        )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := a <> b;" in st
-
-    def test_binary_precedence(self):
-        # (a + b) * c should emit a + b without parens for a + b at top,
-        # but with parens when nested in *
-        inner = BinaryExpr(op=BinaryOp.ADD, left=_ref("a"), right=_ref("b"))
-        outer = BinaryExpr(op=BinaryOp.MUL, left=inner, right=_ref("c"))
-        stmt = Assignment(target=_ref("y"), value=outer)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := (a + b) * c;" in st
 
-    def test_unary_not(self):
-        expr = UnaryExpr(op=UnaryOp.NOT, operand=_ref("x"))
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := NOT x;" in st
+class TestTypeRef:
+    @pytest.mark.parametrize("section, var, expected", _TYPE_REF_CASES)
+    def test_declaration(self, type_ref_st, section, var, expected):
+        assert expected in type_ref_st
 
-    def test_unary_neg(self):
-        expr = UnaryExpr(op=UnaryOp.NEG, operand=_lit("5"))
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := -5;" in st
 
-    def test_function_call(self):
-        expr = FunctionCallExpr(
-            function_name="ABS",
-            args=[CallArg(value=_ref("x"))],
-        )
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := ABS(x);" in st
+# -----------------------------------------------------------------------
+# Expressions
+# -----------------------------------------------------------------------
 
-    def test_array_access(self):
-        expr = ArrayAccessExpr(array=_ref("arr"), indices=[_lit("3")])
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := arr[3];" in st
+# (value assigned to y, expected line) — all rendered from one program;
+# each line is unique.
+_EXPRESSION_CASES = [
+    pytest.param(BinaryExpr(op=BinaryOp.ADD, left=_ref("a"), right=_lit("1")),
+                 "y := a + 1;", id="binary_arithmetic"),
+    pytest.param(BinaryExpr(op=BinaryOp.NE, left=_ref("a"), right=_ref("b")),
+                 "y := a <> b;", id="binary_comparison"),
+    # a + b nested in * needs parens
+    pytest.param(BinaryExpr(
+                     op=BinaryOp.MUL,
+                     left=BinaryExpr(op=BinaryOp.ADD, left=_ref("a"), right=_ref("b")),
+                     right=_ref("c"),
+                 ),
+                 "y := (a + b) * c;", id="binary_precedence"),
+    pytest.param(UnaryExpr(op=UnaryOp.NOT, operand=_ref("x")),
+                 "y := NOT x;", id="unary_not"),
+    pytest.param(UnaryExpr(op=UnaryOp.NEG, operand=_lit("5")),
+                 "y := -5;", id="unary_neg"),
+    pytest.param(FunctionCallExpr(function_name="ABS", args=[CallArg(value=_ref("x"))]),
+                 "y := ABS(x);", id="function_call"),
+    pytest.param(ArrayAccessExpr(array=_ref("arr"), indices=[_lit("3")]),
+                 "y := arr[3];", id="array_access"),
+    pytest.param(MemberAccessExpr(struct=_ref("motor"), member="speed"),
+                 "y := motor.speed;", id="member_access"),
+    pytest.param(BitAccessExpr(target=_ref("w"), bit_index=5),
+                 "y := w.5;", id="bit_access"),
+    pytest.param(TypeConversionExpr(target_type=_real(), source=_ref("x")),
+                 "y := REAL(x);", id="type_conversion"),
+    pytest.param(BinaryExpr(op=BinaryOp.SHL, left=_ref("x"), right=_lit("2")),
+                 "y := SHL(x, 2);", id="shift_as_function"),
+]
+
+
+@pytest.fixture(scope="module")
+def expression_lines() -> frozenset[str]:
+    """Stripped lines of the one program that assigns every case to y."""
+    st = _program_st(*(
+        Assignment(target=_ref("y"), value=case.values[0])
+        for case in _EXPRESSION_CASES
+    ))
+    return frozenset(line.strip() for line in st.splitlines())
 
-    def test_member_access(self):
-        expr = MemberAccessExpr(struct=_ref("motor"), member="speed")
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := motor.speed;" in st
 
-    def test_bit_access(self):
-        expr = BitAccessExpr(target=_ref("w"), bit_index=5)
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := w.5;" in st
-
-    def test_type_conversion(self):
-        expr = TypeConversionExpr(target_type=_real(), source=_ref("x"))
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := REAL(x);" in st
+class TestExpressions:
+    @pytest.mark.parametrize("value, expected", _EXPRESSION_CASES)
+    def test_assignment(self, expression_lines, value, expected):
+        assert expected in expression_lines
 
-    def test_shift_as_function(self):
-        expr = BinaryExpr(op=BinaryOp.SHL, left=_ref("x"), right=_lit("2"))
-        stmt = Assignment(target=_ref("y"), value=expr)
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "y := SHL(x, 2);" in st
+    def test_cases_render_distinct_lines(self):
+        expected = [case.values[1] for case in _EXPRESSION_CASES]
+        assert len(set(expected)) == len(expected)
 
 
 # -----------------------------------------------------------------------
@@ -298,49 +222,45 @@ class TestStatements:
         stmt = IfStatement(
             if_branch=IfBranch(
                 condition=_ref("a"),
-                body=[Assignment(target=_ref("x"), value=_lit("1"))],
+                body=[_assign("x", "1")],
             ),
             elsif_branches=[
                 IfBranch(
                     condition=_ref("b"),
-                    body=[Assignment(target=_ref("x"), value=_lit("2"))],
+                    body=[_assign("x", "2")],
                 ),
             ],
-            else_body=[Assignment(target=_ref("x"), value=_lit("3"))],
+            else_body=[_assign("x", "3")],
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "IF a THEN" in st
-        assert "ELSIF b THEN" in st
-        assert "ELSE" in st
-        assert "END_IF;" in st
+        st = _program_st(stmt)
+        _assert_contains_all(st, [
+            "IF a THEN",
+            "ELSIF b THEN",
+            "ELSE",
+            "END_IF;",
+        ])
 
     def test_case(self):
         stmt = CaseStatement(
             selector=_ref("state"),
             branches=[
                 CaseBranch(values=[0], body=[
-                    Assignment(target=_ref("x"), value=_lit("0")),
+                    _assign("x", "0"),
                 ]),
                 CaseBranch(values=[1, 2], ranges=[CaseRange(start=10, end=20)], body=[
-                    Assignment(target=_ref("x"), value=_lit("1")),
+                    _assign("x", "1"),
                 ]),
             ],
-            else_body=[Assignment(target=_ref("x"), value=_lit("99"))],
+            else_body=[_assign("x", "99")],
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "CASE state OF" in st
-        assert "0:" in st
-        assert "1, 2, 10..20:" in st
-        assert "ELSE" in st
-        assert "END_CASE;" in st
+        st = _program_st(stmt)
+        _assert_contains_all(st, [
+            "CASE state OF",
+            "0:",
+            "1, 2, 10..20:",
+            "ELSE",
+            "END_CASE;",
+        ])
 
     def test_for(self):
         stmt = ForStatement(
@@ -350,13 +270,11 @@ class TestStatements:
             by_expr=_lit("2"),
             body=[Assignment(target=_ref("x"), value=_ref("i"))],
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "FOR i := 0 TO 10 BY 2 DO" in st
-        assert "END_FOR;" in st
+        st = _program_st(stmt)
+        _assert_contains_all(st, [
+            "FOR i := 0 TO 10 BY 2 DO",
+            "END_FOR;",
+        ])
 
     def test_while(self):
         stmt = WhileStatement(
@@ -365,13 +283,11 @@ class TestStatements:
                 op=BinaryOp.ADD, left=_ref("x"), right=_lit("1"),
             ))],
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "WHILE running DO" in st
-        assert "END_WHILE;" in st
+        st = _program_st(stmt)
+        _assert_contains_all(st, [
+            "WHILE running DO",
+            "END_WHILE;",
+        ])
 
     def test_repeat(self):
         stmt = RepeatStatement(
@@ -380,25 +296,21 @@ class TestStatements:
             ))],
             until=BinaryExpr(op=BinaryOp.GE, left=_ref("x"), right=_lit("10")),
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "REPEAT" in st
-        assert "UNTIL x >= 10" in st
-        assert "END_REPEAT;" in st
+        st = _program_st(stmt)
+        _assert_contains_all(st, [
+            "REPEAT",
+            "UNTIL x >= 10",
+            "END_REPEAT;",
+        ])
 
     def test_exit_continue_return(self):
         stmts = [ExitStatement(), ContinueStatement(), ReturnStatement()]
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=stmts)],
-        )
-        st = to_structured_text(pou)
-        assert "EXIT;" in st
-        assert "CONTINUE;" in st
-        assert "RETURN;" in st
+        st = _program_st(*stmts)
+        _assert_contains_all(st, [
+            "EXIT;",
+            "CONTINUE;",
+            "RETURN;",
+        ])
 
     def test_return_value(self):
         stmt = ReturnStatement(value=_ref("result"))
@@ -414,11 +326,7 @@ class TestStatements:
             function_name="LOG",
             args=[CallArg(name="msg", value=_lit("'hello'"))],
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
+        st = _program_st(stmt)
         assert "LOG(msg := 'hello');" in st
 
     def test_fb_invocation(self):
@@ -428,22 +336,16 @@ class TestStatements:
             inputs={"IN": _ref("start"), "PT": _lit("T#5s")},
             outputs={"Q": _ref("done")},
         )
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[stmt])],
-        )
-        st = to_structured_text(pou)
-        assert "ton1(" in st
-        assert "IN := start" in st
-        assert "PT := T#5s" in st
-        assert "Q => done" in st
+        st = _program_st(stmt)
+        _assert_contains_all(st, [
+            "ton1(",
+            "IN := start",
+            "PT := T#5s",
+            "Q => done",
+        ])
 
     def test_empty(self):
-        pou = POU(
-            pou_type=POUType.PROGRAM, name="T",
-            networks=[Network(statements=[EmptyStatement()])],
-        )
-        st = to_structured_text(pou)
+        st = _program_st(EmptyStatement())
         assert ";" in st
 
 
@@ -465,9 +367,11 @@ class TestPOUStructure:
         )
         st = to_structured_text(pou)
         assert st.startswith("FUNCTION_BLOCK Motor\n")
-        assert "END_FUNCTION_BLOCK\n" in st
-        assert "VAR_INPUT" in st
-        assert "VAR_OUTPUT" in st
+        _assert_contains_all(st, [
+            "END_FUNCTION_BLOCK\n",
+            "VAR_INPUT",
+            "VAR_OUTPUT",
+        ])
 
     def test_program(self):
         pou = POU(
@@ -475,8 +379,10 @@ class TestPOUStructure:
             networks=[],
         )
         st = to_structured_text(pou)
-        assert "PROGRAM Main" in st
-        assert "END_PROGRAM" in st
+        _assert_contains_all(st, [
+            "PROGRAM Main",
+            "END_PROGRAM",
+        ])
 
     def test_function_with_return_type(self):
         pou = POU(
@@ -495,8 +401,10 @@ class TestPOUStructure:
             ])],
         )
         st = to_structured_text(pou)
-        assert "FUNCTION Add : INT" in st
-        assert "END_FUNCTION" in st
+        _assert_contains_all(st, [
+            "FUNCTION Add : INT",
+            "END_FUNCTION",
+        ])
 
     def test_extends_implements(self):
         pou = POU(
@@ -535,73 +443,59 @@ class TestPOUStructure:
 # Type definitions
 # -----------------------------------------------------------------------
 
-class TestTypeDefinitions:
-    def test_struct(self):
-        proj = Project(
-            name="T",
-            data_types=[StructType(
-                name="MotorData",
-                members=[
-                    StructMember(name="speed", data_type=_real()),
-                    StructMember(name="running", data_type=_bool(), initial_value="FALSE"),
-                ],
-            )],
-        )
-        st = to_structured_text(proj)
-        assert "TYPE MotorData :" in st
-        assert "STRUCT" in st
-        assert "speed : REAL;" in st
-        assert "running : BOOL := FALSE;" in st
-        assert "END_STRUCT" in st
-        assert "END_TYPE" in st
-
-    def test_enum(self):
-        proj = Project(
-            name="T",
-            data_types=[EnumType(
-                name="State",
-                members=[
-                    EnumMember(name="IDLE", value=0),
-                    EnumMember(name="RUN", value=1),
-                ],
-            )],
-        )
-        st = to_structured_text(proj)
-        assert "TYPE State : (" in st
-        assert "IDLE := 0" in st
-        assert "RUN := 1" in st
-        assert "END_TYPE" in st
+_ALL_DATA_TYPES = [
+    StructType(
+        name="MotorData",
+        members=[
+            StructMember(name="speed", data_type=_real()),
+            StructMember(name="running", data_type=_bool(), initial_value="FALSE"),
+        ],
+    ),
+    EnumType(
+        name="State",
+        members=[
+            EnumMember(name="IDLE", value=0),
+            EnumMember(name="RUN", value=1),
+        ],
+    ),
+    EnumType(
+        name="Mode",
+        base_type=PrimitiveType.DINT,
+        members=[EnumMember(name="A", value=0)],
+    ),
+    AliasType(name="Speed", base_type=_real()),
+    SubrangeType(
+        name="Pct", base_type=PrimitiveType.INT,
+        lower_bound=0, upper_bound=100,
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def data_types_st() -> str:
+    return to_structured_text(Project(name="T", data_types=_ALL_DATA_TYPES))
 
-    def test_enum_with_base_type(self):
-        proj = Project(
-            name="T",
-            data_types=[EnumType(
-                name="State",
-                base_type=PrimitiveType.DINT,
-                members=[EnumMember(name="A", value=0)],
-            )],
-        )
-        st = to_structured_text(proj)
-        assert "TYPE State : DINT (" in st
 
-    def test_alias(self):
-        proj = Project(
-            name="T",
-            data_types=[AliasType(name="Speed", base_type=_real())],
-        )
-        st = to_structured_text(proj)
-        assert "TYPE Speed : REAL;" in st
-
-    def test_subrange(self):
-        proj = Project(
-            name="T",
-            data_types=[SubrangeType(
-                name="Pct", base_type=PrimitiveType.INT,
-                lower_bound=0, upper_bound=100,
-            )],
-        )
-        st = to_structured_text(proj)
-        assert "TYPE Pct : INT(0..100);" in st
+class TestTypeDefinitions:
+    # Every type is rendered from one project, so block keywords are
+    # checked next to the type they belong to.
+    @pytest.mark.parametrize("needle", [
+        pytest.param("TYPE MotorData :\nSTRUCT", id="struct_header"),
+        pytest.param("speed : REAL;", id="struct_member"),
+        pytest.param("running : BOOL := FALSE;", id="struct_member_initial"),
+        pytest.param("running : BOOL := FALSE;\nEND_STRUCT\nEND_TYPE", id="struct_footer"),
+        pytest.param("TYPE State : (", id="enum_header"),
+        pytest.param("IDLE := 0", id="enum_member_first"),
+        pytest.param("RUN := 1", id="enum_member_second"),
+        pytest.param("TYPE Mode : DINT (", id="enum_with_base_type"),
+        pytest.param("TYPE Speed : REAL;", id="alias"),
+        pytest.param("TYPE Pct : INT(0..100);", id="subrange"),
+    ])
+    def test_rendered(self, data_types_st, needle):
+        assert needle in data_types_st
+
+    def test_each_type_closed(self, data_types_st):
+        assert data_types_st.count("END_TYPE") == len(_ALL_DATA_TYPES)
 
 
 # -----------------------------------------------------------------------
@@ -621,9 +515,11 @@ class TestGVL:
             )],
         )
         st = to_structured_text(proj)
-        assert "VAR_GLOBAL" in st
-        assert "speed AT %Q0.0 : REAL;" in st
-        assert "END_VAR" in st
+        _assert_contains_all(st, [
+            "VAR_GLOBAL",
+            "speed AT %Q0.0 : REAL;",
+            "END_VAR",
+        ])
 
 
 # -----------------------------------------------------------------------
@@ -652,48 +548,68 @@ class TestSFC:
             ),
         )
         st = to_structured_text(pou)
-        assert "INITIAL_STEP S0:" in st
-        assert "act0(N);" in st
-        assert "STEP S1:" in st
-        assert "TRANSITION FROM S0 TO S1" in st
-        assert ":= start;" in st
+        _assert_contains_all(st, [
+            "INITIAL_STEP S0:",
+            "act0(N);",
+            "STEP S1:",
+            "TRANSITION FROM S0 TO S1",
+            ":= start;",
+        ])
 
 
 # -----------------------------------------------------------------------
 # Framework integration
 # -----------------------------------------------------------------------
 
+_MOTOR_SRC = (
+    "from plx.framework import *\n\n"
+    "@fb\n"
+    "class Motor:\n"
+    "    cmd = input_var(BOOL)\n"
+    "    running = output_var(BOOL)\n\n"
+    "    def logic(self):\n"
+    "        self.running = self.cmd\n"
+)
+
+
+@pytest.fixture(scope="session")
+def motor_compile_result():
+    """Sandbox compile of _MOTOR_SRC, shared by every check on it."""
+    # Use the sandbox to compile since we need inspect.getsource
+    from web.backend.sandbox import compile_source
+
+    return compile_source(_MOTOR_SRC)
+
+
 class TestFrameworkIntegration:
-    def test_compiled_pou(self):
+    def test_compiled_pou(self, motor_compile_result):
         """Compile a framework @fb and ST-print the result."""
-        # Use the sandbox to compile since we need inspect.getsource
-        from web.backend.sandbox import compile_source
-
-        result = compile_source(
-            "from plx.framework import *\n\n"
-            "@fb\n"
-            "class Motor:\n"
-            "    cmd = input_var(BOOL)\n"
-            "    running = output_var(BOOL)\n\n"
-            "    def logic(self):\n"
-            "        self.running = self.cmd\n"
-        )
-        assert result.success
-        assert "FUNCTION_BLOCK Motor" in result.st
-        assert "running := cmd;" in result.st
+        assert motor_compile_result.success
+
+    @pytest.mark.parametrize("needle", [
+        "FUNCTION_BLOCK Motor",
+        "running := cmd;",
+    ])
+    def test_compiled_pou_st(self, motor_compile_result, needle):
+        assert needle in motor_compile_result.st
 
 
 # -----------------------------------------------------------------------
 # Source map
 # -----------------------------------------------------------------------
 
+# Every variable the Counter FB in test_to_structured_text_source_map_flag
+# references from its body.
+_COUNTER_VAR_NAMES = frozenset({"enable", "reset", "max_count", "count", "done"})
+
+
 class TestSourceMap:
     def test_build_source_map_basic(self):
         st = "count := count + 1;\n"
         entries = _build_source_map(st, {"count"})
         # De-duplicates: first occurrence per variable per line
         assert len(entries) == 1
-        assert entries[0] == {"name": "count", "line": 1, "column": 1}
+        assert entries[0] == SourceMapEntry("count", 1, 1)
 
     def test_build_source_map_no_partial_match(self):
         st = "max_count := 10;\n"
@@ -703,25 +619,53 @@ class TestSourceMap:
     def test_build_source_map_multiline(self):
         st = "IF enable THEN\n    count := count + 1;\nEND_IF;\n"
         entries = _build_source_map(st, {"enable", "count"})
-        names = [(e["name"], e["line"]) for e in entries]
+        names = [(e.name, e.line) for e in entries]
         assert ("enable", 1) in names
         assert ("count", 2) in names
 
     def test_build_source_map_empty(self):
         assert _build_source_map("x := 1;\n", set()) == []
 
+    @pytest.mark.parametrize("st", [
+        "count := count + 1;\n",
+        "max_count := count;\n",
+        "xcount := count1 + count;\n",
+        "a := count// count\n",
+        "a := \u00e9count + count\u00e9 + count;\n",
+        "IF count THEN\n    y := 1; // count\nEND_IF;\ncount",
+        "VAR\n    count : INT;\nEND_VAR\ncount := 0;\n",
+    ])
+    def test_single_name_fast_path_matches_regex(self, st):
+        general = _build_source_map(st, {"count", "not_in_text"})
+        assert _build_source_map(st, {"count"}) == general
+
+    def test_name_pattern_cached_per_name_set(self):
+        first = _variable_name_pattern(frozenset({"count", "enable"}))
+        assert _variable_name_pattern(frozenset({"enable", "count"})) is first
+
     def test_build_source_map_skips_var_blocks(self):
         st = "VAR_INPUT\n    enable : BOOL;\nEND_VAR\nIF enable THEN\nEND_IF;\n"
         entries = _build_source_map(st, {"enable"})
         assert len(entries) == 1
-        assert entries[0]["line"] == 4  # body, not declaration
+        assert entries[0].line == 4  # body, not declaration
+
+    def test_build_source_map_skips_consecutive_var_blocks(self):
+        st = (
+            "VAR_INPUT\n    enable : BOOL;\nEND_VAR\n"
+            "VAR CONSTANT\n    limit : INT := 5;\nEND_VAR\n"
+            "IF enable THEN\n    count := limit;\nEND_IF;\n"
+        )
+        entries = _build_source_map(st, {"enable", "count", "limit"})
+        assert [(e.name, e.line) for e in entries] == [
+            ("enable", 7), ("count", 8), ("limit", 8),
+        ]
 
     def test_build_source_map_skips_comments(self):
         st = "count := 0; // Reset count\n"
         entries = _build_source_map(st, {"count"})
         # Only the code occurrence, not the comment one
         assert len(entries) == 1
-        assert entries[0] == {"name": "count", "line": 1, "column": 1}
+        assert entries[0] == SourceMapEntry("count", 1, 1)
 
     def test_to_structured_text_source_map_flag(self):
         """to_structured_text(source_map=True) returns (str, list)."""
@@ -743,8 +687,8 @@ class TestSourceMap:
                     if_branch=IfBranch(
                         condition=_ref("reset"),
                         body=[
-                            Assignment(target=_ref("count"), value=_lit("0")),
-                            Assignment(target=_ref("done"), value=_lit("FALSE")),
+                            _assign("count", "0"),
+                            _assign("done", "FALSE"),
                         ],
                     ),
                     elsif_branches=[IfBranch(
@@ -793,16 +737,40 @@ class TestSourceMap:
 
         # All variable names should appear
         found_names = {e["name"] for e in smap}
-        assert {"enable", "reset", "max_count", "count", "done"} <= found_names
+        assert _COUNTER_VAR_NAMES <= found_names
 
         # All entries have correct structure
         for entry in smap:
+            assert type(entry) is dict
             assert "name" in entry
             assert "line" in entry
             assert "column" in entry
             assert entry["line"] >= 1
             assert entry["column"] >= 1
 
+    def test_project_source_map_covers_every_pou(self):
+        def _pou(name: str, var: str) -> POU:
+            return POU(
+                pou_type=POUType.PROGRAM, name=name,
+                interface=POUInterface(static_vars=[
+                    Variable(name=var, data_type=_int()),
+                ]),
+                networks=[Network(statements=[
+                    Assignment(target=_ref(var), value=_ref("g")),
+                ])],
+            )
+
+        proj = Project(
+            name="P",
+            pous=[_pou("A", "a"), _pou("B", "b")],
+            global_variable_lists=[GlobalVariableList(
+                name="GVL", variables=[Variable(name="g", data_type=_int())],
+            )],
+        )
+        _st, smap = to_structured_text(proj, source_map=True)
+        # Only POU interface variables are mapped, not globals
+        assert {e["name"] for e in smap} == {"a", "b"}
+
     def test_to_structured_text_without_source_map(self):
         """to_structured_text() without source_map returns plain str."""
         pou = POU(
@@ -830,8 +798,9 @@ class TestSourceMap:
         st, smap = to_structured_text(pou, source_map=True)
         lines = st.splitlines()
 
-        for entry in smap:
-            line_text = lines[entry["line"] - 1]
-            col = entry["column"] - 1  # 0-indexed
-            name = entry["name"]
-            assert line_text[col:col + len(name)] == name
+        assert smap
+        misplaced = [
+            e for e in smap
+            if not lines[e["line"] - 1].startswith(e["name"], e["column"] - 1)
+        ]
+        assert misplaced == []
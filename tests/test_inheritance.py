@@ -31,19 +31,29 @@ class _Derived(_Base):
         self.z = not self.x
 
 
+@pytest.fixture(scope="module")
+def base_pou() -> POU:
+    return _Base.compile()
+
+
+@pytest.fixture(scope="module")
+def derived_pou() -> POU:
+    return _Derived.compile()
+
+
 # ---------------------------------------------------------------------------
 # extends field
 # ---------------------------------------------------------------------------
 
 class TestExtends:
-    def test_base_has_no_extends(self):
-        assert _Base.compile().extends is None
+    def test_base_has_no_extends(self, base_pou):
+        assert base_pou.extends is None
 
-    def test_derived_has_extends(self):
-        assert _Derived.compile().extends == "_Base"
+    def test_derived_has_extends(self, derived_pou):
+        assert derived_pou.extends == "_Base"
 
-    def test_pou_type_preserved(self):
-        assert _Derived.compile().pou_type == POUType.FUNCTION_BLOCK
+    def test_pou_type_preserved(self, derived_pou):
+        assert derived_pou.pou_type == POUType.FUNCTION_BLOCK
 
 
 # ---------------------------------------------------------------------------
@@ -51,20 +61,17 @@ class TestExtends:
 # ---------------------------------------------------------------------------
 
 class TestVariableInheritance:
-    def test_derived_inherits_inputs(self):
-        pou = _Derived.compile()
-        input_names = [v.name for v in pou.interface.input_vars]
+    def test_derived_inherits_inputs(self, derived_pou):
+        input_names = [v.name for v in derived_pou.interface.input_vars]
         assert "x" in input_names
 
-    def test_derived_has_own_outputs(self):
-        pou = _Derived.compile()
-        output_names = [v.name for v in pou.interface.output_vars]
+    def test_derived_has_own_outputs(self, derived_pou):
+        output_names = [v.name for v in derived_pou.interface.output_vars]
         assert "y" in output_names  # inherited
         assert "z" in output_names  # own
 
-    def test_parent_vars_come_first(self):
-        pou = _Derived.compile()
-        output_names = [v.name for v in pou.interface.output_vars]
+    def test_parent_vars_come_first(self, derived_pou):
+        output_names = [v.name for v in derived_pou.interface.output_vars]
         assert output_names.index("y") < output_names.index("z")
 
 
@@ -116,16 +123,14 @@ class TestVariableOverride:
 # ---------------------------------------------------------------------------
 
 class TestSuperLogic:
-    def test_inlines_parent_statements(self):
-        pou = _Derived.compile()
-        stmts = pou.networks[0].statements
+    def test_inlines_parent_statements(self, derived_pou):
+        stmts = derived_pou.networks[0].statements
         # Parent: 1 assignment (y = x)
         # Child: 1 assignment (z = not x)
         assert len(stmts) == 2
 
-    def test_parent_statement_first(self):
-        pou = _Derived.compile()
-        stmts = pou.networks[0].statements
+    def test_parent_statement_first(self, derived_pou):
+        stmts = derived_pou.networks[0].statements
         # First statement should be parent's y = x
         assert isinstance(stmts[0], Assignment)
         assert stmts[0].target.name == "y"
@@ -133,6 +138,13 @@ class TestSuperLogic:
         assert isinstance(stmts[1], Assignment)
         assert stmts[1].target.name == "z"
 
+    def test_parent_source_read_once(self):
+        """Inlining reuses the source cached when the parent was decorated."""
+        from plx.framework._compiler import function_source
+
+        parent_logic = _Base.__dict__["logic"]
+        assert function_source(parent_logic) is parent_logic._plx_source
+
     def test_super_in_middle(self):
         @fb
         class Parent:
@@ -3,6 +3,8 @@
 import ast
 import textwrap
 
+import pytest
+
 from plx.framework import (
     BOOL,
     REAL,
@@ -13,11 +15,31 @@ from plx.framework import (
     output_var,
     program,
 )
+from plx.framework._compiler import _dedent_block
 from plx.framework._decorators import _extract_comments, _split_body_by_comments
 from plx.model.pou import POU
 from plx.model.statements import FBInvocation, IfStatement
 
 
+# ---------------------------------------------------------------------------
+# Unit tests: _dedent_block
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("lines", [
+    pytest.param(["    def logic(self):\n", "        # note\n", "        pass\n"], id="method"),
+    pytest.param(["def logic(self):\n", "    pass\n"], id="no_margin"),
+    pytest.param(["\tdef logic(self):\n", "\t\tpass\n"], id="tabs"),
+    pytest.param(["    def logic(self):\n", "      \n", "        pass"], id="blank_line"),
+    pytest.param(
+        ["    def logic(self):\n", '        x = """\n', "a\n", '"""\n'],
+        id="string_below_margin",
+    ),
+])
+def test_dedent_block_matches_textwrap(lines):
+    assert _dedent_block(lines) == textwrap.dedent("".join(lines))
+
+
 # ---------------------------------------------------------------------------
 # Unit tests: _extract_comments
 # ---------------------------------------------------------------------------
@@ -446,3 +468,15 @@ class TestNetworkComments:
         pou = Empty.compile()
         assert len(pou.networks) == 1
         assert pou.networks[0].comment is None
+        assert pou.networks[0].statements == []
+
+    def test_commented_pass_keeps_comment(self):
+        @fb
+        class Empty:
+            def logic(self):
+                # Reserved for later
+                pass
+
+        pou = Empty.compile()
+        assert len(pou.networks) == 1
+        assert pou.networks[0].comment == "Reserved for later"
@@ -608,6 +608,57 @@ class TestFBInvocation:
         _run(outer_pou, state, pou_registry={"Inner": inner_pou})
         assert state["result"] == 10
 
+    def test_instances_of_same_fb_keep_separate_state(self):
+        """Instances sharing an FB type must not share state."""
+        counter_pou = POU(
+            pou_type=POUType.FUNCTION_BLOCK,
+            name="Counter",
+            interface=POUInterface(
+                input_vars=[Variable(name="step", data_type=PrimitiveTypeRef(type=PrimitiveType.INT))],
+                output_vars=[Variable(name="count", data_type=PrimitiveTypeRef(type=PrimitiveType.INT))],
+            ),
+            networks=[Network(statements=[
+                Assignment(
+                    target=VariableRef(name="count"),
+                    value=BinaryExpr(
+                        op=BinaryOp.ADD,
+                        left=VariableRef(name="count"),
+                        right=VariableRef(name="step"),
+                    ),
+                ),
+            ])],
+        )
+
+        outer_pou = make_pou([
+            FBInvocation(
+                instance_name="a",
+                fb_type="Counter",
+                inputs={"step": LiteralExpr(value="1")},
+                outputs={"count": VariableRef(name="a_count")},
+            ),
+            FBInvocation(
+                instance_name="b",
+                fb_type="Counter",
+                inputs={"step": LiteralExpr(value="10")},
+                outputs={"count": VariableRef(name="b_count")},
+            ),
+        ])
+
+        state = {
+            "a": {"step": 0, "count": 0},
+            "b": {"step": 0, "count": 0},
+            "a_count": 0,
+            "b_count": 0,
+        }
+        engine = ExecutionEngine(
+            pou=outer_pou, state=state, clock_ms=0,
+            pou_registry={"Counter": counter_pou},
+        )
+        engine.execute()
+        engine.execute()
+        assert state["a_count"] == 2
+        assert state["b_count"] == 20
+
 
 # ---------------------------------------------------------------------------
 # Return statement
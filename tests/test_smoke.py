@@ -2,6 +2,8 @@
 
 import json
 
+from pydantic import BaseModel
+
 from plx.framework import (
     BOOL,
     DINT,
@@ -122,6 +124,10 @@ class TestSmokeEndToEnd:
         assert restored.pou_type == POUType.FUNCTION_BLOCK
         assert len(restored.interface.input_vars) == 4
 
+    def test_pou_json_matches_pydantic_encoder(self):
+        pou = PneumaticActuator.compile()
+        assert pou.model_dump_json() == BaseModel.model_dump_json(pou)
+
     def test_function_has_return_type(self):
         pou = Clamp.compile()
         assert pou.return_type is not None
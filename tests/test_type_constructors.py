@@ -31,6 +31,11 @@ class TestResolveTypeRef:
         result = _resolve_type_ref(PrimitiveType.BOOL)
         assert result == PrimitiveTypeRef(type=PrimitiveType.BOOL)
 
+    def test_primitive_type_enum_refs_are_independent(self):
+        first = _resolve_type_ref(PrimitiveType.BOOL)
+        first.type = PrimitiveType.INT
+        assert _resolve_type_ref(PrimitiveType.BOOL).type == PrimitiveType.BOOL
+
     def test_primitive_type_ref_passthrough(self):
         ref = PrimitiveTypeRef(type=PrimitiveType.INT)
         assert _resolve_type_ref(ref) is ref